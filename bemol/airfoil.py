@@ -4,11 +4,37 @@ Classes defining airfoils and methods for working with polars.
 
 """
 
+import bisect
+import functools
 from pathlib import Path
 
 import numpy as np
 from scipy import interpolate
-from scipy import optimize
+
+
+# piecewise polynomial interpolators available by name
+_SPLINES = dict(
+    cubic=interpolate.CubicSpline,
+    pchip=interpolate.PchipInterpolator,
+    )
+
+
+def _clampedSpline(spline,lower:float,upper:float,aoa):
+    """Spline evaluated at angles of attack clipped to the polar range."""
+    return spline(np.clip(aoa,lower,upper))
+
+
+@functools.lru_cache(maxsize=None)
+def _readPolar(file:Path,mtime:int) -> np.ndarray:
+    """Parsed content of a polar file.
+
+    Cached by absolute path and modification time, so a polar shared by
+    several rotors (or rotors created several times) is read only once.
+    The array is read-only, the airfoils copy its columns.
+    """
+    polar_data = np.genfromtxt(file,dtype=np.float64)
+    polar_data.setflags(write=False)
+    return polar_data
 
 
 class BaseAirfoil(object):
@@ -18,28 +44,86 @@ class BaseAirfoil(object):
     ----------
     file
         path to .foil file with the polars definition.
-    interpolator : callable, optional
+    interpolator : callable or str, optional
         function for defining the interpolation method to look for the
-        aerodynamic coefficients given an angle of attack. Default is 
-        scipy interpolate.interp1d with default parameters.
+        aerodynamic coefficients given an angle of attack, called as
+        `interpolator(alpha,coefficients)`. Can also be 'cubic' or 'pchip'
+        for scipy CubicSpline and PchipInterpolator, with coefficients
+        precomputed at construction. Default is None, linear interpolation
+        with numpy.interp. Outside of the polar, the coefficients of the
+        first or last angle of attack are returned by the linear and spline
+        interpolations.
     
     """
     
-    def __init__(self,file,interpolator=interpolate.interp1d):
+    def __init__(self,file,interpolator=None):
         airfoil_file = Path(file)
         if not airfoil_file.is_file():
             raise ValueError(f'Airfoil (polar) file not found ({file}).')
         self.file = file
 
-        polar_data = np.genfromtxt(airfoil_file)
-        self._alpha = np.radians(polar_data[:,0])
-        self._cl = polar_data[:,1]
-        self._cd = polar_data[:,2]
-
-        self._interp_cl = interpolator(self._alpha,self._cl)
-        self._interp_cd = interpolator(self._alpha,self._cd)
+        airfoil_file = airfoil_file.resolve()
+        polar_data = _readPolar(airfoil_file,airfoil_file.stat().st_mtime_ns)
+        # contiguous float64 columns for the interpolation, the conversion
+        # to radians already returns a new contiguous array (no extra copy)
+        self._alpha = np.ascontiguousarray(np.radians(polar_data[:,0]),dtype=np.float64)
+        self._cl = np.ascontiguousarray(polar_data[:,1],dtype=np.float64)
+        self._cd = np.ascontiguousarray(polar_data[:,2],dtype=np.float64)
+
+        if interpolator is None:
+            # linear interpolation, much cheaper than interp1d for scalars
+            self._interp_cl = self._linear_cl
+            self._interp_cd = self._linear_cd
+        elif isinstance(interpolator,str):
+            if interpolator not in _SPLINES:
+                raise ValueError(
+                    f'Unknown interpolator {interpolator}, must be one of {list(_SPLINES)}.'
+                    )
+            spline = _SPLINES[interpolator]
+            bounds = (self._alpha[0],self._alpha[-1])
+            self._interp_cl = functools.partial(
+                _clampedSpline,spline(self._alpha,self._cl),*bounds
+                )
+            self._interp_cd = functools.partial(
+                _clampedSpline,spline(self._alpha,self._cd),*bounds
+                )
+        else:
+            self._interp_cl = interpolator(self._alpha,self._cl)
+            self._interp_cd = interpolator(self._alpha,self._cd)
+
+        # python lists for the scalar lookups
+        self._is_linear = interpolator is None
+        self._alpha_list = self._alpha.tolist()
+        self._cl_list = self._cl.tolist()
+        self._cd_list = self._cd.tolist()
     
 
+    def _linear_cl(self,aoa):
+        return np.interp(aoa,self._alpha,self._cl)
+
+
+    def _linear_cd(self,aoa):
+        return np.interp(aoa,self._alpha,self._cd)
+
+
+    def _interval(self,aoa):
+        """Index of the polar interval of aoa."""
+        alpha = self._alpha_list
+        index = bisect.bisect_right(alpha,aoa) - 1
+        return min(max(index,0),len(alpha) - 2)
+
+
+    def _scalar(self,aoa,index,values):
+        """Linear interpolation in given interval, same as numpy.interp."""
+        alpha = self._alpha_list
+        if aoa <= alpha[0]:
+            return values[0]
+        if aoa >= alpha[-1]:
+            return values[-1]
+        slope = (values[index + 1] - values[index])/(alpha[index + 1] - alpha[index])
+        return slope*(aoa - alpha[index]) + values[index]
+
+
     @property
     def polar(self):
         """Return alpha, lift and drag coefficients."""
@@ -60,6 +144,45 @@ class BaseAirfoil(object):
     def cd(self,aoa):
         """Drag coefficients of polar at angle of attack."""
         return self._interp_cd(aoa)
+
+
+    def cl_scalar(self,aoa:float) -> float:
+        """Lift coefficient at a single angle of attack.
+
+        Same as `cl` for the default linear interpolation, without the numpy
+        overhead on a single float. Nothing is stored on the airfoil, so it
+        can be shared by several sections, solvers or threads. Custom
+        interpolators are called directly.
+        """
+        if not self._is_linear:
+            return self._interp_cl(aoa)
+        return self._scalar(aoa,self._interval(aoa),self._cl_list)
+
+
+    def cd_scalar(self,aoa:float) -> float:
+        """Drag coefficient at a single angle of attack.
+
+        See `cl_scalar`.
+        """
+        if not self._is_linear:
+            return self._interp_cd(aoa)
+        return self._scalar(aoa,self._interval(aoa),self._cd_list)
+
+
+    def cl_cd(self,aoa):
+        """Lift and drag coefficients of polar at angle of attack.
+
+        Same values as `cl` and `cd`. For a single angle of attack and the
+        default linear interpolation, the polar interval is searched once for
+        both coefficients (see `cl_scalar`).
+        """
+        if not (self._is_linear and isinstance(aoa,(float,int))):
+            return self._interp_cl(aoa), self._interp_cd(aoa)
+        index = self._interval(aoa)
+        return (
+            self._scalar(aoa,index,self._cl_list),
+            self._scalar(aoa,index,self._cd_list),
+            )
     
 
 
@@ -73,8 +196,8 @@ class DynStallAirfoil(BaseAirfoil):
     def __init__(self,file):
         super().__init__(file)
 
-        self.splineLift = interpolate.interp1d(self._alpha,self._cl)
-        self.splineDrag = interpolate.interp1d(self._alpha,self._cd)
+        self.splineLift = functools.partial(np.interp,xp=self._alpha,fp=self._cl)
+        self.splineDrag = functools.partial(np.interp,xp=self._alpha,fp=self._cd)
 
         self.splineStaticAttachment = 0.
         self.splineFullySeparatedLift = 0.
@@ -90,27 +213,45 @@ class DynStallAirfoil(BaseAirfoil):
 
     def estimateFullySeparatedLift(self, attackAngles):
 
-        clFS = []
-        for attackAngle in attackAngles:
-
-            coeff = self.cl(attackAngle)
-            clFA = self.cl0Slope * (attackAngle - self.aoaZero)
-            staticAttachment = self.splineStaticAttachment(attackAngle)
-
-            limit = 0.975
-            if (staticAttachment < limit):
-                cl_s = (coeff - staticAttachment * clFA)/(1.-min(1.,staticAttachment))
-            else:
-                # Numerical issues...
-                cl_s = coeff / 2.
-            clFS.append(cl_s)
-
-        self.splineFullySeparatedLift = interpolate.interp1d(attackAngles,clFS)
+        attackAngles = np.asarray(attackAngles)
+        coeff = self.cl(attackAngles)
+        clFA = self.cl0Slope * (attackAngles - self.aoaZero)
+        staticAttachment = self.splineStaticAttachment(attackAngles)
+
+        limit = 0.975
+        isSeparated = staticAttachment < limit
+        # mask the denominator where not used to avoid division by zero
+        denominator = np.where(isSeparated,1.-np.minimum(1.,staticAttachment),1.)
+        clFS = np.where(
+            isSeparated,
+            (coeff - staticAttachment * clFA)/denominator,
+            coeff / 2., # Numerical issues...
+            )
+
+        self.splineFullySeparatedLift = functools.partial(
+            np.interp,xp=attackAngles,fp=clFS
+            )
         return
 
 
     def estimateAoaZero(self):
-        self.aoaZero = optimize.brentq(self.splineLift,np.radians(-10.),0.,args=())
+        # root of the linear interpolation between -10 and 0 deg, obtained
+        # from the first interval where the lift changes of sign
+        lower, upper = np.radians(-10.), 0.
+        inner = (self._alpha > lower) & (self._alpha < upper)
+        aoas = np.concatenate(([lower],self._alpha[inner],[upper]))
+        lifts = self.splineLift(aoas)
+
+        crossings = np.flatnonzero(lifts[:-1]*lifts[1:] <= 0.)
+        if crossings.size == 0:
+            raise ValueError(
+                f'Zero lift angle of attack not found between -10 and 0 deg ({self.file}).'
+                )
+        k = crossings[0]
+        if lifts[k] == lifts[k+1]:
+            self.aoaZero = aoas[k]
+        else:
+            self.aoaZero = aoas[k] - lifts[k]*(aoas[k+1] - aoas[k])/(lifts[k+1] - lifts[k])
         return
 
 
@@ -121,15 +262,19 @@ class DynStallAirfoil(BaseAirfoil):
 
 
     def estimateAttachmentDegree(self, attackAngles):
-        staticAttachment = []
-        for attackAngle in attackAngles:
-            coeff = self.cl(attackAngle)
-            clFA = self.cl0Slope*(attackAngle-self.aoaZero)
-            # Since clFA is an estimate, sometimes for aoa<0 lift < clFA
-            static_attachment = (np.sqrt(np.abs(coeff/clFA))*2.0 - 1.0)**2.0
-            staticAttachment.append( max(0.0,min(static_attachment,1.0)) )
-
-        self.splineStaticAttachment = interpolate.interp1d(attackAngles,staticAttachment)
+        attackAngles = np.asarray(attackAngles)
+        coeff = self.cl(attackAngles)
+        clFA = self.cl0Slope*(attackAngles-self.aoaZero)
+        # Since clFA is an estimate, sometimes for aoa<0 lift < clFA
+        with np.errstate(divide='ignore',invalid='ignore'):
+            staticAttachment = (np.sqrt(np.abs(coeff/clFA))*2.0 - 1.0)**2.0
+        # null lift and null estimate (clFA == 0) considered as separated
+        staticAttachment = np.where(np.isnan(staticAttachment),0.0,staticAttachment)
+        staticAttachment = np.clip(staticAttachment,0.0,1.0)
+
+        self.splineStaticAttachment = functools.partial(
+            np.interp,xp=attackAngles,fp=staticAttachment
+            )
 
         return
 
@@ -1,6 +1,10 @@
 
 
+import copy
+import functools
 import inspect
+import math
+import os
 
 import numpy as np
 
@@ -9,6 +13,39 @@ from . import secondary
 from . import tools
 
 
+# Scalar kernels of the momentum equations. They are called for every
+# evaluation of the residuals, math functions avoid the numpy overhead on
+# single floats. See `BaseBEM` methods of same name for the documentation.
+
+def _scalarCT(a:float,F:float,chi:float) -> float:
+    return 4.0*a*F*math.sqrt(1.0 - a*(2.*math.cos(chi) - a))
+
+
+def _scalarCqMomentum(a:float,aprime:float,Ux:float,Uy:float,
+                      F:float,chi:float,psi:float,gamma:float) -> float:
+    cosPsi = math.cos(psi)
+    sinPsi = math.sin(psi)
+    cosChi = math.cos(chi)
+    return 4.0*(Uy/Ux)*aprime*F*(math.cos(gamma) - a)*(
+        cosPsi*cosPsi + cosChi*cosChi*sinPsi*sinPsi
+        )
+
+
+# available secondary effects, keyed by the name of the class with a lower
+# first letter (name of the attribute in Corrections)
+_SECONDARY_CLASSES = {
+    name[0].lower() + name[1:]: obj
+    for name, obj in inspect.getmembers(secondary) if inspect.isclass(obj)
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _effectNames(correction_name:str) -> tuple:
+    """Names of the effects a correction is inner of, from its qualname."""
+    return tuple(
+        _name for _name, obj in _SECONDARY_CLASSES.items()
+        if obj.__qualname__ in correction_name
+        )
 
 
 class Corrections(object):
@@ -27,30 +64,28 @@ class Corrections(object):
         secondary.py with a lower first letter.
     
     """
-    def __init__(self,corrections:dict={}):
-        for name, obj in inspect.getmembers(secondary):
-            if inspect.isclass(obj):
-                _name = name[0].lower() + name[1:]
-                if type(corrections) is dict:
-                    if _name in corrections:
-                        # instantiation of correction with default values
-                        corr = corrections[_name]
-                        corr = corr() if isinstance(corr,type) else corr
+    def __init__(self,corrections:dict=None):
+        corrections = {} if corrections is None else corrections
+        for _name, obj in _SECONDARY_CLASSES.items():
+            if type(corrections) is dict and _name in corrections:
+                # instantiation of correction with default values
+                corr = corrections[_name]
+                corr = corr() if isinstance(corr,type) else corr
+                setattr(self,_name,corr)
+            else:
+                setattr(self,_name,obj.Dummy())
+
+        if type(corrections) is not dict:
+            # check if any of the input corrections are inner of the
+            # available corrections, first one is kept
+            selected = set()
+            for corr in corrections:
+                # instantiation of correction with default values
+                corr = corr() if isinstance(corr,type) else corr
+                for _name in _effectNames(type(corr).__qualname__):
+                    if _name not in selected:
                         setattr(self,_name,corr)
-                    else:
-                        setattr(self,_name,obj.Dummy())
-                else:
-                    effect_name = obj.__qualname__
-                    setattr(self,_name,obj.Dummy())
-                    # loop for all effects to check if any of the input
-                    # corrections are inner of the available corrections
-                    for corr in corrections:
-                        # instantiation of correction with default values
-                        corr = corr() if isinstance(corr,type) else corr
-                        correction_name = type(corr).__qualname__
-                        if effect_name in correction_name:
-                            setattr(self,_name,corr)
-                            break
+                        selected.add(_name)
 
 
     def __iter__(self):
@@ -59,6 +94,12 @@ class Corrections(object):
             yield value
 
 
+    @property
+    def _restartable(self) -> tuple:
+        """Stateful corrections, restarted for each section."""
+        return tuple(corr for corr in self if hasattr(corr,'restart'))
+
+
 class BaseBEM:
     """Base BEM class.
 
@@ -82,6 +123,12 @@ class BaseBEM:
 
     """
     
+    # vectorized solution of all the sections, solveBlade(sections,
+    # azimuth,pitch,velocities,...), to be defined by the models that
+    # support it. Only used if the corrections accept arrays, see
+    # `_useSolveBlade`
+    solveBlade = None
+
     def __init__(self,rotor:rotor.Rotor,rho:float=1.225,corrections:dict=None):
         
         self.rotor = rotor
@@ -90,9 +137,28 @@ class BaseBEM:
 
         if corrections is None: corrections = {}
         self.corrections = Corrections(corrections)
+
+        # arguments of the pre function, evaluated once for all calls
+        self._pre_arg_names = tuple(
+            name for name in inspect.signature(self.pre).parameters
+            if name not in ('args','kwargs')
+            )
         
 
 
+    @property
+    def _has_twss(self) -> bool:
+        """If a high-induction model is defined.
+
+        Without it the empirical region is the same as the momentum one, no
+        need to call the correction. Checked at each call, the correction can
+        be set after construction.
+        """
+        return not isinstance(
+            self.corrections.turbulentWakeState,secondary.TurbulentWakeState.Dummy
+            )
+
+
     @staticmethod
     def CT(a,F:float=1.0,chi:float=0.0) -> float:
         """Base thrust coefficient formulation.
@@ -119,17 +185,19 @@ class BaseBEM:
     def CtMomentum(self,a,aprime,F,chi) -> float:
         """Calculate thrust coefficient.
 
-        The aprime (tangential induction) is not used.
+        The aprime (tangential induction) is not used. For arrays of
+        inductions the regions (momentum, empirical and propeller brake) are
+        all evaluated and selected without branching.
 
         Parameters
         ----------
-        a : float
+        a : float or array
             axial induction factor
-        aprime : float
+        aprime : float or array
             tangential induction factor
-        F : float
+        F : float or array
             loss factor
-        chi : float
+        chi : float or array
             wake skew angle in radians
         
         Returns
@@ -139,16 +207,25 @@ class BaseBEM:
         """
         beta = 0.4
 
+        if np.ndim(a) > 0:
+            # all regions are cheap to evaluate
+            momentum = self.CT(a,F,chi)
+            brake = 4.*a*F*(a - 1.0)*np.cos(chi)
+            empirical = self.corrections.turbulentWakeState(a,F,chi)
+            return np.where(a <= beta,momentum,np.where(a > 1.0,brake,empirical))
+
         if a <= beta:
             # Momentum region
-            return self.CT(a,F,chi)
+            return _scalarCT(a,F,chi)
         elif a > 1.0:
-            # Propeller brake region
-            print('Unexpected propeller brake state...')
-            return 4.*a*F*(a - 1.0)*np.cos(chi)
-        else:
+            # Propeller brake region, reported by the solvers
+            return 4.*a*F*(a - 1.0)*math.cos(chi)
+        elif self._has_twss:
             # Empirical region
             return self.corrections.turbulentWakeState(a,F,chi)
+        else:
+            # Empirical region without correction, see TurbulentWakeState.Dummy
+            return _scalarCT(a,F,chi)
 
 
     def CqMomentum(self,a:float,aprime:float,Ux:float,Uy:float,
@@ -182,9 +259,7 @@ class BaseBEM:
 
         """
         # yaw instead of skew
-        return 4.0*(Uy/Ux)*aprime*F*(np.cos(gamma) - a)*(
-            np.cos(psi)**2. + np.cos(chi)**2.*np.sin(psi)**2.
-            )
+        return _scalarCqMomentum(a,aprime,Ux,Uy,F,chi,psi,gamma)
     
 
     def update(self,**kwargs):
@@ -209,6 +284,88 @@ class BaseBEM:
                 raise ValueError(f'This solver has no attribute {key}')
     
 
+    def _sectionIndexes(self,elements) -> np.ndarray:
+        """Indexes of the sections to consider.
+
+        The indexes are used to slice the per section arrays of the rotor
+        (radius, twist, chords) and its list of sections.
+
+        Parameters
+        ----------
+        elements
+            slice or list of indexes of sections.
+
+        Returns
+        -------
+        array of indexes.
+
+        """
+        if type(elements) is slice:
+            return np.arange(self.n)[elements]
+        return np.asarray(list(elements),dtype=int)
+
+
+    def _taskSolver(self):
+        """Independent copy of the solver for a task of an executor.
+
+        The rotor is shared, the corrections and the state of the solution
+        (attributes set by `update` and the residuals) are copied, so the
+        tasks can run in threads without changing the solution of each other.
+        """
+        solver = copy.copy(self)
+        solver.corrections = copy.deepcopy(self.corrections)
+        return solver
+
+
+    def _useSolveBlade(self) -> bool:
+        """If the sections can be solved at once by `solveBlade`.
+
+        The model must define it, without `pre` function, and the corrections
+        must be stateless and accept arrays: the corrections of secondary.py,
+        or user corrections with a `vectorized` attribute set to True. User
+        corrections written for floats only are solved section by section.
+        """
+        if self.solveBlade is None or len(self._pre_arg_names) > 0 \
+           or len(self.corrections._restartable) > 0:
+            return False
+        return all(
+            getattr(corr,'vectorized',type(corr).__module__ == secondary.__name__)
+            for corr in self.corrections
+            )
+
+
+    def _solveGroups(self,executor,method:str,indexes,*args,**kwargs) -> list:
+        """Solve groups of sections in parallel with an executor.
+
+        The sections are split in as many groups as processors, each group
+        is solved by a task calling `method` (name of the solution method,
+        steady or cycle) of an independent copy of the solver, with the
+        indexes of the group as `elements`.
+
+        Returns
+        -------
+        list of (position of the group in indexes, result of the method).
+
+        """
+        if len(self.corrections._restartable) > 0:
+            raise ValueError(
+                'Sections cannot be solved in parallel with stateful corrections!'
+                )
+        groups = np.array_split(indexes,min(len(indexes),os.cpu_count() or 1))
+        futures = [
+            executor.submit(
+                getattr(self._taskSolver(),method),*args,elements=group,**kwargs
+                )
+            for group in groups
+            ]
+        results = []
+        start = 0
+        for group, future in zip(groups,futures):
+            results.append((slice(start,start + len(group)),future.result()))
+            start += len(group)
+        return results
+
+
     def pre(self,*args,**kwargs) -> dict:
         """Function to update inputs of solver for given azimuth and section.
 
@@ -224,8 +381,8 @@ class BaseBEM:
 
 
     def steady(self,azimuth:float,pitch:float,wind:float,omega:float,*args,
-               angles:list=[0.0,0.0],precone:float=0.0,elements=slice(None),
-               **kwargs):
+               angles:tuple=(0.0,0.0),precone:float=0.0,elements=slice(None),
+               out:tuple=None,executor=None,**kwargs):
         """Solving the BEM equations for a given section for steady condition.
         
         Considers that the flow is steady, return the forces and induction
@@ -250,34 +407,69 @@ class BaseBEM:
         elements
             slice or list of indexes of sections to consider.
             If default - slice(None) - considers all the sections,
+        out : tuple, optional
+            arrays (forces, inductions) of shape (number of sections, 2) where
+            the results are written. New arrays are created if not given.
+        executor : concurrent.futures.Executor, optional
+            if given, the sections are split in as many groups as processors
+            and the groups are solved in parallel by the executor, a
+            ProcessPoolExecutor or a ThreadPoolExecutor (each group is solved
+            by a copy of the solver). Not possible with stateful corrections
+            (dynamic inflow).
         kwargs
             extra key arguments of the solve method.
         """
         
-        if type(elements) is slice:
-            sections_to_consider = self.rotor.sections[elements]
+        indexes = self._sectionIndexes(elements)
+        sections_to_consider = [self.rotor.sections[i] for i in indexes]
+        radii = self.rotor.radius[indexes]
+        number_sections = len(indexes)
+
+        if out is None:
+            forces = np.empty([number_sections,2])
+            inductions = np.empty([number_sections,2])
         else:
-            sections_to_consider = [self.rotor.sections[i] for i in elements]
-        number_sections = len(sections_to_consider)
+            forces, inductions = out
 
-        forces = np.zeros([number_sections,2])
-        inductions = np.zeros([number_sections,2])
+        if executor is not None:
+            # sections are independent, solve groups of them in parallel
+            results = self._solveGroups(
+                executor,'steady',indexes,azimuth,pitch,wind,omega,*args,
+                angles=angles,precone=precone,**kwargs
+                )
+            for position, (groupForces, groupInductions) in results:
+                forces[position], inductions[position] = groupForces, groupInductions
+            return forces, inductions
+
+        # velocities of all the sections at once, only the radius changes
+        velocities = tools.calculateVelocities(
+            wind,omega,radii,azimuth,angles[0],angles[1],precone
+            )
+
+        pre_args = self._pre_arg_names
+        if self._useSolveBlade():
+            # stateless corrections, all the sections are solved at once
+            fn, ft, a, aprime = self.solveBlade(
+                sections_to_consider,azimuth,pitch,*args,
+                velocities=velocities,angles=angles,**kwargs
+                )
+            forces[:,0], forces[:,1] = fn, ft
+            inductions[:,0], inductions[:,1] = a, aprime
+            return forces, inductions
 
-        # TODO: very very bad practice! replace this by obj attributes!
-        pre_args = list(inspect.signature(self.pre).parameters.keys())
-        for _k in ('args','kwargs'):
-            if _k in pre_args: pre_args.remove(_k)
-        
-        _locals = locals()
         if len(pre_args) > 0:
+            # inputs constant for all sections, section and velocity are
+            # updated inside the loop
+            step_inputs = dict(
+                azimuth=azimuth,pitch=pitch,wind=wind,omega=omega,
+                angles=angles,precone=precone,
+                )
             pre_inputs = {
-                name:_locals[name] for name in pre_args if name in _locals
+                name:step_inputs[name] for name in pre_args if name in step_inputs
                 }
         # loop for all sections
         for i, section in enumerate(sections_to_consider):
-            velocity = tools.calculateVelocity(
-                wind,omega,section.radius,azimuth,angles[0],angles[1],precone
-            )
+            velocity = velocities[i]
             if len(pre_args) > 0:
                 # update loop evolving values
                 if 'section' in pre_args: pre_inputs['section'] = section
@@ -297,7 +489,7 @@ class BaseBEM:
 
 
     def dynamic(self,azimuth:list,pitch:list,wind:list,omega:list,*args,
-               angles:list=[0.0,0.0],precone:float=0.0,elements=slice(None),
+               angles:tuple=(0.0,0.0),precone:float=0.0,elements=slice(None),
                **kwargs):
         """Dynamic solution for set of states.
 
@@ -329,49 +521,47 @@ class BaseBEM:
         """
         
         
-        if type(elements) is slice:
-            sections_to_consider = self.rotor.sections[elements]
-        else:
-            sections_to_consider = [self.rotor.sections[i] for i in elements]
-        number_sections = len(sections_to_consider)
+        indexes = self._sectionIndexes(elements)
+        sections_to_consider = [self.rotor.sections[i] for i in indexes]
+        radii = self.rotor.radius[indexes]
+        number_sections = len(indexes)
         
-        # loop for all steps
         # select any input that is a list and make the others the same
         # if they are not
-        inputs = dict(azimuth=azimuth,pitch=pitch,wind=wind,omega=omega)
-        number_steps = 1
-        for key, val in inputs.items():
-            try:
-                if len(val) > 1:
-                    number_steps = max(len(val),number_steps)
-            except TypeError:
-                inputs[key] = [val]
-        for key, val in inputs.items():
-            if len(val) == 1: inputs[key] = val*number_steps
-
-        forces = np.zeros((number_sections,number_steps,2))
-        factors = np.zeros((number_sections,number_steps,2))
+        inputs = [np.atleast_1d(val) for val in (azimuth,pitch,wind,omega)]
+        number_steps = max(len(val) for val in inputs)
+        azimuths, pitchs, winds, omegas = (
+            np.broadcast_to(val,number_steps) for val in inputs
+            )
+
+        forces = np.empty((number_sections,number_steps,2))
+        factors = np.empty((number_sections,number_steps,2))
         
+        # velocities of all steps and sections at once, shape (steps,
+        # sections): the trigonometric functions of the angles are
+        # evaluated once for the whole blade
+        velocitiesX, velocitiesY = np.broadcast_arrays(*tools.calculateVelocity(
+            winds[:,None],omegas[:,None],radii[None,:],azimuths[:,None],
+            angles[0],angles[1],precone
+        ))
+
         # loop for all sections
         for i, section in enumerate(sections_to_consider):
             # loop for all steps
-            for ii, (_azi, _pit, _wnd, _omg) in enumerate(zip(*inputs.values())):
-                velocity = tools.calculateVelocity(
-                    _wnd,_omg,section.radius,azimuth,
-                    angles[0],angles[1],precone
-                )
+            for ii in range(number_steps):
+                velocity = (velocitiesX[ii,i],velocitiesY[ii,i])
                 forces[i,ii,0], forces[i,ii,1], factors[i,ii,0], factors[i,ii,1] = self.solve(
-                    section,_azi,_pit,*args,
+                    section,azimuths[ii],pitchs[ii],*args,
                     velocity=velocity,angles=angles,**kwargs
                     )
-            for corr in self.corrections.__dict__.values():
-                if hasattr(corr,'restart'): corr.restart()
+            for corr in self.corrections._restartable:
+                corr.restart()
         
         return forces, factors
 
     
     def cycle(self,pitch:float,wind,omega:float,*args,
-              angles:list=[0.0,0.0],precone:float=0.0,
+              angles:tuple=(0.0,0.0),precone:float=0.0,
               N=1.0,dt:float=None,delta_phi:float=None,n_phi:int=36,
               **kwargs):
         """Solve for a given number of revolutions.
@@ -399,6 +589,10 @@ class BaseBEM:
             azimuthal step, rad.
         n_phi: int
             number of azimuthal steps. Optional, 36 by default.
+        executor : concurrent.futures.Executor, optional
+            if given, the sections are split in as many groups as processors
+            and the cycle of each group is solved by the executor. See
+            `bem.BaseBEM.steady`.
         kwargs
             extra key arguments for call to `solve`
         
@@ -410,30 +604,65 @@ class BaseBEM:
         
         """
 
-        if delta_phi is not None:
-            pass
-        elif dt is not None:
+        if delta_phi is None and dt is not None:
             delta_phi = dt*omega
+
+        if delta_phi is not None:
+            # last azimuth included if it falls on the final revolution
+            n_phi = int(np.floor(N*2.0*np.pi/delta_phi + 1e-8)) + 1
+            azimuths = delta_phi*np.arange(n_phi)
         elif n_phi is not None:
-            delta_phi = 2.0*np.pi*N/(n_phi - 1)
+            azimuths = np.linspace(0.0,N*2.0*np.pi,n_phi)
         else:
             raise ValueError(f'Timestep or azimuthal step must be defined')
 
-        azimuths = np.arange(0.0,N*2*np.pi+delta_phi,delta_phi)
-        n_phi = len(azimuths)
-
         # forces and inductions can have different size from what is defined
         # inside the steady solution (elements argument)
-        forces, inductions = [], []
+        indexes = self._sectionIndexes(kwargs.get('elements',slice(None)))
+        number_sections = len(indexes)
+        forces = np.empty((n_phi,number_sections,2))
+        inductions = np.empty((n_phi,number_sections,2))
+
+        executor = kwargs.pop('executor',None)
+        if executor is not None:
+            # sections are independent, each group of them is solved for
+            # all the azimuths by the executor
+            kwargs.pop('elements',None)
+            results = self._solveGroups(
+                executor,'cycle',indexes,pitch,wind,omega,*args,
+                angles=angles,precone=precone,N=N,dt=dt,delta_phi=delta_phi,
+                n_phi=n_phi,**kwargs
+                )
+            for position, (groupForces, groupInductions, _) in results:
+                forces[:,position], inductions[:,position] = groupForces, groupInductions
+            return forces, inductions, azimuths
+
+        if self._useSolveBlade():
+            # stateless corrections, the azimuths are independent and all
+            # the (azimuth, section) pairs are solved at once
+            solveKwargs = {
+                key:val for key, val in kwargs.items() if key not in ('elements','out')
+                }
+            radii = self.rotor.radius[indexes]
+            velocitiesX, velocitiesY = np.broadcast_arrays(*tools.calculateVelocity(
+                wind,omega,radii[None,:],azimuths[:,None],angles[0],angles[1],precone
+            ))
+            fn, ft, a, aprime = self.solveBlade(
+                [self.rotor.sections[i] for i in indexes]*n_phi,
+                np.repeat(azimuths,number_sections),pitch,*args,
+                velocities=np.stack((velocitiesX.ravel(),velocitiesY.ravel()),axis=-1),
+                angles=angles,**solveKwargs
+                )
+            forces[...,0], forces[...,1] = (np.reshape(val,(n_phi,number_sections)) for val in (fn,ft))
+            inductions[...,0], inductions[...,1] = (np.reshape(val,(n_phi,number_sections)) for val in (a,aprime))
+            return forces, inductions, azimuths
 
-        # loop for all azimuths
+        # loop for all azimuths, results written in place
         for i, azimuth in enumerate(azimuths):
-            _forces, _inductions = self.steady(
+            self.steady(
                 azimuth,pitch,wind,omega,*args,
-                angles=angles,precone=precone,**kwargs
+                angles=angles,precone=precone,out=(forces[i],inductions[i]),
+                **kwargs
             )
-            forces.append(_forces)
-            inductions.append(_inductions)
 
-        
-        return np.array(forces), np.array(inductions), azimuths
\ No newline at end of file
+        return forces, inductions, azimuths
\ No newline at end of file
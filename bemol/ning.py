@@ -1,6 +1,11 @@
 
 
 
+import copy
+import functools
+import math
+import warnings
+
 import numpy as np
 from scipy import optimize
 from scipy.optimize import minimize
@@ -15,6 +20,130 @@ PI_QUARTER = float(np.pi/4.0)
 TWO_PI = float(2.0*np.pi)
 
 
+def _uncoupledResiduals(inflowAngle:float,Ux:float,Uy:float,angle:float,
+                        sigmaPrime:float,radius:float,nBlades:int,
+                        hubRadius:float,tipRadius:float,epsilon:float,
+                        funPolar,hubTipLoss) -> tuple:
+    """Residual and inductions of uncoupled Ning algorithm.
+
+    Free function of scalars, with `math` instead of NumPy calls, evaluated
+    by `NingUncoupled.residuals` for each iteration of the root finder.
+
+    Returns
+    -------
+    residual value, axial and tangential induction factors.
+
+    """
+    attackAngle = inflowAngle - angle
+
+    lift, drag = funPolar(attackAngle)
+
+    cosInflow = math.cos(inflowAngle)
+    sinInflow = math.sin(inflowAngle)
+    Cx = lift*cosInflow + drag*sinInflow
+    Cy = lift*sinInflow - drag*cosInflow
+
+    F = hubTipLoss(radius,nBlades,hubRadius,tipRadius,inflowAngle)
+
+    loadFactor = sigmaPrime / (4.*F*sinInflow)
+    kappa = loadFactor * Cx / sinInflow
+    kappaPrime = loadFactor * Cy / cosInflow
+
+    axialInd = 0.0
+    tangentialInd = 0.0
+    maxAxialInd = 2.0
+    maxTangentialInd = 2.0
+
+    isValidSolution = True
+    isMomentumRegion = False
+    if ( (inflowAngle >= 0.0 and Ux >= 0.0) or (inflowAngle < 0.0 and Ux < 0.0)):
+        isMomentumRegion = True
+
+    if isMomentumRegion == True:
+        if kappa <= 2.0/3.0:
+            axialInd = kappa / (1.+kappa)
+            if kappa < -1.0:
+                isValidSolution = False
+        else:
+            twoF_Kappa = 2.0*F*kappa
+            gamma1 = twoF_Kappa - (10.0/9.0 - F)
+            gamma2 = twoF_Kappa - F*(4.0/3.0 - F)
+            gamma3 = twoF_Kappa - (25.0/9.0 - 2.0*F)
+
+            if abs(gamma3) < epsilon:
+                axialInd = 1.0 - 1.0/(2.0*math.sqrt(gamma2))
+            else:
+                axialInd = (gamma1 - math.sqrt(abs(gamma2))) / gamma3
+    else:
+        # propeller brake region
+        axialInd = kappa / (kappa - 1.0)
+        if kappa <= 1.0:
+            isValidSolution = False
+        elif (axialInd > maxAxialInd):
+            axialInd = maxAxialInd
+
+    if Ux <= 0.0:
+        kappaPrime = -kappaPrime
+
+    tangentialInd = kappaPrime / (1. - kappaPrime)
+    if abs(tangentialInd) > maxTangentialInd:
+        tangentialInd = math.copysign(maxTangentialInd,tangentialInd)
+
+    if isValidSolution == False:
+        axialInd = 0.0
+        tangentialInd = 0.0
+
+    if isMomentumRegion:
+        residuals = sinInflow/(1.0 - axialInd) \
+                    - Ux/Uy*cosInflow/(1.0 + tangentialInd)
+    else:
+        residuals = sinInflow/(1.0 - kappa) \
+                    - Ux/Uy*cosInflow/(1.0 + tangentialInd)
+
+    return residuals, axialInd, tangentialInd
+
+
+def _liftDrag(funLift,funDrag,attackAngle) -> tuple:
+    """Lift and drag coefficients from separate functions."""
+    return funLift(attackAngle), funDrag(attackAngle)
+
+
+def _evaluatePolar(groups:list,size:int,coefficient:str,attackAngles):
+    """Coefficient of several sections, grouped by airfoil."""
+    values = np.empty(size)
+    for airfoil, indexes in groups:
+        values[indexes] = getattr(airfoil,coefficient)(attackAngles[indexes])
+    return values
+
+
+def _bladePolars(sections:list):
+    """Lift and drag functions of several sections.
+
+    Sections sharing the same airfoil are interpolated together.
+
+    Parameters
+    ----------
+    sections : list
+        list of bemol.section.Section objects.
+
+    Returns
+    -------
+    functions returning the lift and drag coefficients of all the sections
+    from an array with their angles of attack.
+
+    """
+    groups = {}
+    for i, _section in enumerate(sections):
+        groups.setdefault(id(_section.airfoil),(_section.airfoil,[]))[1].append(i)
+    groups = [(airfoil, np.array(indexes)) for airfoil, indexes in groups.values()]
+
+    # partials instead of closures, the solver can be pickled (executors)
+    funLift = functools.partial(_evaluatePolar,groups,len(sections),'cl')
+    funDrag = functools.partial(_evaluatePolar,groups,len(sections),'cd')
+
+    return funLift, funDrag
+
+
 class NingUncoupled(bem.BaseBEM):
     """Ning uncoupled.
     
@@ -47,10 +176,15 @@ class NingUncoupled(bem.BaseBEM):
         function that return the lift coefficient from the angle of attack.
     _funDrag: callable
         function that return the drag coefficient from the angle of attack.
+    _funPolar: callable
+        function that return the lift and drag coefficients from the angle
+        of attack. Built from `_funLift` and `_funDrag` if not given.
     _chord: float
         sectional chord, m.
     _radius: float
         sectional radius, m.
+    _sigmaPrime: float
+        local solidity, from the number of blades, chord and radius.
 
     """
 
@@ -67,8 +201,10 @@ class NingUncoupled(bem.BaseBEM):
         self._angle = 0.0
         self._funLift = None
         self._funDrag = None
+        self._funPolar = None
         self._chord = 0.0
         self._radius = 0.0
+        self._sigmaPrime = 0.0
 
 
     def residuals(self,inflowAngle:float,) -> float:
@@ -88,82 +224,37 @@ class NingUncoupled(bem.BaseBEM):
         
         """
         
-        attackAngle = inflowAngle - self._angle
-
-        lift = self._funLift(attackAngle)
-        drag = self._funDrag(attackAngle)
-
-        Cx = lift*np.cos(inflowAngle) + drag*np.sin(inflowAngle)
-        Cy = lift*np.sin(inflowAngle) - drag*np.cos(inflowAngle)
-
-        F = self.corrections.hubTipLoss(
-            self._radius,self.rotor.nBlades,
-            self.rotor.hubRadius,self.rotor.tipRadius,inflowAngle
+        residuals, axialInd, tangentialInd = _uncoupledResiduals(
+            inflowAngle,self._Ux,self._Uy,self._angle,self._sigmaPrime,self._radius,
+            self.rotor.nBlades,self.rotor.hubRadius,self.rotor.tipRadius,
+            self.epsilon,self._funPolar,self.corrections.hubTipLoss
             )
 
-        sigmaPrime = self.rotor.nBlades * self._chord / ( TWO_PI*self._radius )
-        kappa = sigmaPrime * Cx / (4.*F*np.sin(inflowAngle)**2.)
-        kappaPrime = sigmaPrime * Cy / (4.*F*np.sin(inflowAngle)*np.cos(inflowAngle))
-
-        axialInd = 0.0
-        tangentialInd = 0.0
-        maxAxialInd = 2.0
-        maxTangentialInd = 2.0
-
-        isValidSolution = True
-        isMomentumRegion = False
-        if ( (inflowAngle >= 0.0 and self._Ux >= 0.0) or (inflowAngle < 0.0 and self._Ux < 0.0)):
-            isMomentumRegion = True
-
-        if isMomentumRegion == True:
-            if kappa <= 2.0/3.0:
-                axialInd = kappa / (1.+kappa)
-                if kappa < -1.0:
-                    isValidSolution = False
-            else:
-                twoF_Kappa = 2.0*F*kappa
-                gamma1 = twoF_Kappa - (10.0/9.0 - F)
-                gamma2 = twoF_Kappa - F*(4.0/3.0 - F)
-                gamma3 = twoF_Kappa - (25.0/9.0 - 2.0*F)
-
-                if np.abs(gamma3) < self.epsilon:
-                    axialInd = 1.0 - 1.0/(2.0*np.sqrt(gamma2))
-                else:
-                    axialInd = (gamma1 - np.sqrt(np.abs(gamma2))) / gamma3
-        else:
-            # propeller brake region
-            axialInd = kappa / (kappa - 1.0)
-            if kappa <= 1.0:
-                isValidSolution = False
-            elif (axialInd > maxAxialInd):
-                axialInd = maxAxialInd
-
-        if self._Ux <= 0.0:
-            kappaPrime = -kappaPrime
+        self._axial_induction = axialInd
+        self._tangential_induction = tangentialInd
 
-        tangentialInd = kappaPrime / (1. - kappaPrime)
-        if np.abs(tangentialInd) > maxTangentialInd:
-            tangentialInd = maxTangentialInd*np.sign(tangentialInd)
+        return residuals
 
-        if isValidSolution == False:
-            axialInd = 0.0
-            tangentialInd = 0.0
 
-        if isMomentumRegion:
-            residuals = np.sin(inflowAngle)/(1.0 - axialInd) \
-                        - self._Ux/self._Uy*np.cos(inflowAngle)/(1.0 + tangentialInd)
-        else:
-            residuals = np.sin(inflowAngle)/(1.0 - kappa) \
-                        - self._Ux/self._Uy*np.cos(inflowAngle)/(1.0 + tangentialInd)
+    def update(self,**kwargs):
+        """Update the state of the section and the local solidity.
 
-        self._axial_induction = axialInd
-        self._tangential_induction = tangentialInd
+        The local solidity is constant for all the calls of the residuals,
+        it is calculated once when the chord or the radius change. The
+        polar function is rebuilt from the lift and drag functions if they
+        are given without it.
 
-        return residuals
+        See `bemol.bem.BaseBEM.update`.
+        """
+        super().update(**kwargs)
+        if 'funPolar' not in kwargs and ('funLift' in kwargs or 'funDrag' in kwargs):
+            self._funPolar = functools.partial(_liftDrag,self._funLift,self._funDrag)
+        if 'chord' in kwargs or 'radius' in kwargs:
+            self._sigmaPrime = self.rotor.nBlades * self._chord / ( TWO_PI*self._radius )
 
 
     def solve(self,section:section.Section,azimuth:float,pitch:float,
-              velocity:list=[0.0,0.0,0.0],angles=[0.0,0.0],tStep=0.0):
+              velocity:tuple=(0.0,0.0,0.0),angles:tuple=(0.0,0.0),tStep=0.0):
         """Solve the uncoupled Ning algorithm.
         
         Parameters
@@ -175,9 +266,9 @@ class NingUncoupled(bem.BaseBEM):
             azimuthal angle of blade, radians.
         pitch : float
             blade pitch angle, in radians.
-        velocity : list, optional
+        velocity : list or tuple, optional
             axial, tangential (normally omega * r) and radial velocity, m/s.
-        angles : list, optional
+        angles : list or tuple, optional
             inflow yaw and tilt angles, radians.
         tStep: float, optional
             timestep duration, seconds.
@@ -197,8 +288,10 @@ class NingUncoupled(bem.BaseBEM):
         angle = section.twist + pitch
         chord = section.chord
         radius = section.radius
-        funDrag = section.airfoil.cd
-        funLift = section.airfoil.cl
+        # scalar lookups, same values as cl and cd
+        funDrag = section.airfoil.cd_scalar
+        funLift = section.airfoil.cl_scalar
+        funPolar = section.airfoil.cl_cd
 
         # radial velocity not used
         Ux = velocity[0]
@@ -207,28 +300,223 @@ class NingUncoupled(bem.BaseBEM):
         # update the flow state before calculating the residuals
         self.update(
             Ux=Ux,Uy=Uy,
-            angle=angle,funLift=funLift,funDrag=funDrag,
+            angle=angle,funLift=funLift,funDrag=funDrag,funPolar=funPolar,
             chord=chord,radius=radius,
             )
         
         residualEpsilon = self.residuals(self.epsilon)
         residualPiOvTwo = self.residuals(PI_HALF)
 
+        # brentq is kept on purpose: brenth, toms748 and a pure Python
+        # Chandrupatla need more evaluations of the residuals or are slower
+        # for this problem. It is started from the bracket only, the root
+        # does not depend on the previous solutions
         if residualEpsilon * residualPiOvTwo < 0.0:
-            inflowAngle = optimize.brentq(self.residuals,self.epsilon,PI_HALF,)
+            inflowAngle = optimize.brentq(self.residuals,self.epsilon,PI_HALF)
         else:
             residualMinusEpsilon = self.residuals(-self.epsilon)
             residualMinPiOvFour = self.residuals(-PI_QUARTER)
 
             if residualMinusEpsilon*residualMinPiOvFour < 0.0:
                 # propeller break region
-                inflowAngle = optimize.brentq(
-                    self.residuals,-PI_QUARTER,-self.epsilon,
-                    )
+                inflowAngle = optimize.brentq(self.residuals,-PI_QUARTER,-self.epsilon)
             else:
-                inflowAngle = optimize.brentq(
-                    self.residuals,PI_HALF,PI - self.epsilon,
-                    )
+                inflowAngle = optimize.brentq(self.residuals,PI_HALF,PI - self.epsilon)
+
+        # yawModel: apply to axial induction only
+        wakeSkewAngle = self.corrections.skewAngle(
+            self._axial_induction,yaw)
+        self._axial_induction = self.corrections.yawModel(
+            self._axial_induction,wakeSkewAngle,azimuth,radius,
+            self.rotor.hubRadius,self.rotor.tipRadius
+            )
+        self._axial_induction = self.corrections.dynamicInflow(
+            self._axial_induction,Ux,radius,tStep)
+
+        uxRelative = Ux * (1.0 - self._axial_induction)
+        uthetaRelative = Uy * (1.0 + self._tangential_induction)
+        inflowAngle = math.atan2(uxRelative, uthetaRelative)
+
+        attackAngle = inflowAngle - angle
+        liftCoeff, dragCoeff = funPolar(attackAngle)
+
+        # rotation from lift/drag to normal/tangential coefficients
+        cosAttack = math.cos(attackAngle)
+        sinAttack = math.sin(attackAngle)
+        normalCoeff = liftCoeff * cosAttack + dragCoeff * sinAttack
+        tangentialCoeff = -liftCoeff * sinAttack + dragCoeff * cosAttack
+
+        # square of the relative velocity
+        W2 = uxRelative*uxRelative + uthetaRelative*uthetaRelative
+
+        normalForce = 0.5*self.rho*W2*chord*normalCoeff
+        tangentialForce = 0.5*self.rho*W2*chord*tangentialCoeff
+
+        return normalForce, tangentialForce, self._axial_induction, self._tangential_induction
+
+
+    def residualsBlade(self,inflowAngles:np.ndarray) -> np.ndarray:
+        """Residuals of uncoupled Ning algorithm for several sections.
+
+        Vectorized version of `residuals`, the state of the solver (set by
+        `solveBlade`) is made of arrays with one value per section. The
+        branches of the scalar version are replaced by masks.
+
+        Parameters
+        ----------
+        inflowAngles: array
+            inflow angles of the sections in radians
+        
+        Return
+        ------
+        array of residual values
+        
+        """
+        Ux = self._Ux
+        attackAngles = inflowAngles - self._angle
+
+        lift = self._funLift(attackAngles)
+        drag = self._funDrag(attackAngles)
+
+        cosInflow = np.cos(inflowAngles)
+        sinInflow = np.sin(inflowAngles)
+        Cx = lift*cosInflow + drag*sinInflow
+        Cy = lift*sinInflow - drag*cosInflow
+
+        F = self.corrections.hubTipLoss(
+            self._radius,self.rotor.nBlades,
+            self.rotor.hubRadius,self.rotor.tipRadius,inflowAngles
+            )
+
+        maxAxialInd = 2.0
+        maxTangentialInd = 2.0
+
+        with np.errstate(divide='ignore',invalid='ignore'):
+            sigmaPrime = self._sigmaPrime
+            kappa = sigmaPrime * Cx / (4.*F*sinInflow*sinInflow)
+            kappaPrime = sigmaPrime * Cy / (4.*F*sinInflow*cosInflow)
+
+            isMomentumRegion = ((inflowAngles >= 0.0) & (Ux >= 0.0)) \
+                               | ((inflowAngles < 0.0) & (Ux < 0.0))
+            isLowKappa = kappa <= 2.0/3.0
+
+            # momentum region, low and high kappa
+            axialLow = kappa / (1.+kappa)
+            twoF_Kappa = 2.0*F*kappa
+            gamma1 = twoF_Kappa - (10.0/9.0 - F)
+            gamma2 = twoF_Kappa - F*(4.0/3.0 - F)
+            gamma3 = twoF_Kappa - (25.0/9.0 - 2.0*F)
+            isSmallGamma3 = np.abs(gamma3) < self.epsilon
+            axialHighSmallGamma3 = 1.0 - 1.0/(2.0*np.sqrt(gamma2))
+            axialHigh = (gamma1 - np.sqrt(np.abs(gamma2))) \
+                        / np.where(isSmallGamma3,self.epsilon,gamma3)
+            # propeller brake region
+            axialBrake = np.minimum(kappa / (kappa - 1.0),maxAxialInd)
+
+            isValidSolution = np.where(
+                isMomentumRegion,~(isLowKappa & (kappa < -1.0)),kappa > 1.0
+                )
+            # all the branches are evaluated and selected by region, the
+            # first true condition is used
+            axialInd = np.select(
+                [
+                    ~isValidSolution,
+                    isMomentumRegion & isLowKappa,
+                    isMomentumRegion & isSmallGamma3,
+                    isMomentumRegion,
+                ],
+                [0.0,axialLow,axialHighSmallGamma3,axialHigh],
+                default=axialBrake,
+                )
+
+            kappaPrime = np.where(Ux <= 0.0,-kappaPrime,kappaPrime)
+            tangentialInd = np.clip(
+                kappaPrime / (1. - kappaPrime),-maxTangentialInd,maxTangentialInd
+                )
+            tangentialInd = np.where(isValidSolution,tangentialInd,0.0)
+
+            residuals = sinInflow/(1.0 - np.where(isMomentumRegion,axialInd,kappa)) \
+                        - Ux/self._Uy*cosInflow/(1.0 + tangentialInd)
+
+        self._axial_induction = axialInd
+        self._tangential_induction = tangentialInd
+
+        return residuals
+
+
+    def solveBlade(self,sections:list,azimuth,pitch:float,
+                   velocities:np.ndarray,angles:tuple=(0.0,0.0),tStep=0.0):
+        """Solve the uncoupled Ning algorithm for several sections at once.
+
+        Same as `solve`, but the inflow angles of all the sections are found
+        simultaneously with a vectorized brentq (`bemol.tools.brentq`)
+        instead of one call to scipy brentq per section: same brackets and
+        iterations, so the same root is selected when the residuals change of
+        sign several times. The corrections must accept arrays.
+        
+        Parameters
+        ----------
+        sections : list
+            list of bemol.section.Section objects.
+        azimuth : float or array
+            azimuthal angle of blade, radians, or one per section.
+        pitch : float
+            blade pitch angle, in radians.
+        velocities : array
+            array of shape (number of sections, 2) with the axial and
+            tangential velocities, m/s.
+        angles : list or tuple, optional
+            inflow yaw and tilt angles, radians.
+        tStep: float, optional
+            timestep duration, seconds.
+        
+        Returns
+        -------
+        arrays with the sectional forces and induction factors.
+        
+        """
+
+        # tilt not used!
+        yaw = angles[0]
+
+        angle = np.array([s.twist for s in sections]) + pitch
+        chord = np.array([s.chord for s in sections])
+        radius = np.array([s.radius for s in sections])
+        funLift, funDrag = _bladePolars(sections)
+
+        Ux = np.asarray(velocities)[:,0]
+        Uy = np.asarray(velocities)[:,1]
+
+        # update the flow state before calculating the residuals
+        self.update(
+            Ux=Ux,Uy=Uy,
+            angle=angle,funLift=funLift,funDrag=funDrag,
+            chord=chord,radius=radius,
+            )
+
+        # same brackets as the scalar solution, selected for each section
+        residualEpsilon = self.residualsBlade(np.full(radius.size,self.epsilon))
+        residualPiOvTwo = self.residualsBlade(np.full(radius.size,PI_HALF))
+        residualMinusEpsilon = self.residualsBlade(np.full(radius.size,-self.epsilon))
+        residualMinPiOvFour = self.residualsBlade(np.full(radius.size,-PI_QUARTER))
+        residualPiMinusEpsilon = self.residualsBlade(np.full(radius.size,PI - self.epsilon))
+
+        isPositive = residualEpsilon * residualPiOvTwo < 0.0
+        # propeller break region
+        isBrake = ~isPositive & (residualMinusEpsilon*residualMinPiOvFour < 0.0)
+        lower = np.where(isPositive,self.epsilon,np.where(isBrake,-PI_QUARTER,PI_HALF))
+        upper = np.where(isPositive,PI_HALF,np.where(isBrake,-self.epsilon,PI - self.epsilon))
+        funLower = np.where(
+            isPositive,residualEpsilon,np.where(isBrake,residualMinPiOvFour,residualPiOvTwo)
+            )
+        funUpper = np.where(
+            isPositive,residualPiOvTwo,np.where(isBrake,residualMinusEpsilon,residualPiMinusEpsilon)
+            )
+
+        inflowAngle = tools.brentq(
+            self.residualsBlade,lower,upper,funLower=funLower,funUpper=funUpper
+            )
+        # inductions of the last evaluation of the residuals, as in solve
 
         # yawModel: apply to axial induction only
         wakeSkewAngle = self.corrections.skewAngle(
@@ -248,13 +536,17 @@ class NingUncoupled(bem.BaseBEM):
         liftCoeff = funLift(attackAngle)
         dragCoeff = funDrag(attackAngle)
 
-        normalCoeff = liftCoeff * np.cos(attackAngle) + dragCoeff * np.sin(attackAngle)
-        tangentialCoeff = -liftCoeff * np.sin(attackAngle) + dragCoeff * np.cos(attackAngle)
+        # rotation from lift/drag to normal/tangential coefficients
+        cosAttack = np.cos(attackAngle)
+        sinAttack = np.sin(attackAngle)
+        normalCoeff = liftCoeff * cosAttack + dragCoeff * sinAttack
+        tangentialCoeff = -liftCoeff * sinAttack + dragCoeff * cosAttack
 
-        uRelative = np.sqrt(uxRelative**2. + uthetaRelative**2.)
+        # square of the relative velocity
+        W2 = uxRelative*uxRelative + uthetaRelative*uthetaRelative
 
-        normalForce = 0.5*self.rho*uRelative**2.*chord*normalCoeff
-        tangentialForce = 0.5*self.rho*uRelative**2.*chord*tangentialCoeff
+        normalForce = 0.5*self.rho*W2*chord*normalCoeff
+        tangentialForce = 0.5*self.rho*W2*chord*tangentialCoeff
 
         return normalForce, tangentialForce, self._axial_induction, self._tangential_induction
 
@@ -288,6 +580,13 @@ class NingCoupled(bem.BaseBEM):
     See `NingUncoupled` for the remaining attributes.
     """
 
+    # if True, the inductions are first searched as the root of the thrust
+    # and torque residuals (scipy hybr), the bounded Powell minimization of
+    # their square sum being the fallback. The roots are converged where
+    # Powell can stop at its maximum number of evaluations (yawed flow), so
+    # the results differ from the default minimization
+    useHybridRoot = False
+
     def __init__(self,*args,**kwargs):
         super().__init__(*args,**kwargs)
 
@@ -307,6 +606,13 @@ class NingCoupled(bem.BaseBEM):
         self._skew = 0.0 
         self._yaw = 0.0
         self._azimuth = 0.0
+        # trigonometry of the constant angles, see update
+        self._cosSkew = 1.0
+        self._sinSkew = 0.0
+        self._cosAzimuth = 1.0
+        self._sinAzimuth = 0.0
+        # inductions and intermediate values of the last residuals
+        self._last_evaluation = None
         
         self._axial_induction = 0.0
         self._tangential_induction = 0.0
@@ -314,14 +620,51 @@ class NingCoupled(bem.BaseBEM):
         self._angle = 0.0
         self._funLift = None
         self._funDrag = None
+        self._funPolar = None
         self._chord = 0.0
         self._radius = 0.0
+        self._sigmaPrime = 0.0
+
+
+    def update(self,**kwargs):
+        """Update the state of the section and the constants of the residuals.
+
+        Skew and azimuth are constant for all the calls of the residuals,
+        their sine and cosine are calculated once here, as well as the
+        local solidity.
+
+        See `bemol.bem.BaseBEM.update`.
+        """
+        super().update(**kwargs)
+        self._last_evaluation = None
+        if 'funPolar' not in kwargs and ('funLift' in kwargs or 'funDrag' in kwargs):
+            self._funPolar = functools.partial(_liftDrag,self._funLift,self._funDrag)
+        if 'chord' in kwargs or 'radius' in kwargs:
+            self._sigmaPrime = self.rotor.nBlades * self._chord / (TWO_PI*self._radius)
+        if 'skew' in kwargs:
+            self._cosSkew = math.cos(self._skew)
+            self._sinSkew = math.sin(self._skew)
+        if 'azimuth' in kwargs:
+            self._cosAzimuth = math.cos(self._azimuth)
+            self._sinAzimuth = math.sin(self._azimuth)
+
+
+    def _taskSolver(self):
+        """Independent copy of the solver, with its own uncoupled solver.
+
+        See `bemol.bem.BaseBEM._taskSolver`.
+        """
+        solver = super()._taskSolver()
+        solver._uncoupled = copy.copy(self._uncoupled)
+        solver._uncoupled.corrections = solver.corrections
+        return solver
 
 
     def pre(self,section,omega,wind,precone) -> dict:
         """Calculate prime velocities at a given radius."""
-        UxPrime = wind*np.cos(precone)
-        UyPrime = omega*section.radius*np.cos(precone)
+        cosPrecone = math.cos(precone)
+        UxPrime = wind*cosPrecone
+        UyPrime = omega*section.radius*cosPrecone
         return dict(UxPrime=UxPrime,UyPrime=UyPrime,)
 
 
@@ -338,30 +681,77 @@ class NingCoupled(bem.BaseBEM):
         square sum of the residuals.
 
         """
+        thrustResidual, torqueResidual = self._residualPair(inductions)
+        return thrustResidual*thrustResidual + torqueResidual*torqueResidual
+
+
+    def hubVelocities(self,axialInduction:float,tangentialInduction:float,
+                      wakeSkewAngle:float,cosWakeSkew:float,sinWakeSkew:float) -> tuple:
+        """Axial and tangential velocities at the section, m/s.
+
+        Uses the skew and azimuth of the current state, see `update`.
+
+        Parameters
+        ----------
+        axialInduction, tangentialInduction : float
+            induction factors.
+        wakeSkewAngle : float
+            wake skew angle, radians, and its cosine and sine.
+
+        """
+        uxHub = self._UxPrime*(self._cosSkew-axialInduction) \
+                + self._UyPrime*tangentialInduction*sinWakeSkew*self._cosAzimuth*(1.+sinWakeSkew*self._sinAzimuth)
+        uyHub = self._UyPrime*(1.+tangentialInduction*cosWakeSkew*(1.+sinWakeSkew*self._sinAzimuth)) \
+                + self._UxPrime*self._cosAzimuth*(axialInduction*math.tan(wakeSkewAngle/2.)-self._sinSkew)
+        return uxHub, uyHub
+
+
+    def residualsVector(self,inductions,) -> np.ndarray:
+        """Thrust and torque residuals of coupled Ning algorithm.
+        
+        Parameters
+        ----------
+        inductions : list
+            list of axial and tangential inductions.
+
+        Returns
+        -------
+        array with the thrust and torque residuals.
+
+        """
+        return np.array(self._residualPair(inductions))
 
-        residuals = np.zeros(2)
 
+    def _residualPair(self,inductions) -> tuple:
+        """Thrust and torque residuals as floats, see `residualsVector`."""
         axialInduction = inductions[0]
         tangentialInduction = inductions[1]
 
         wakeSkewAngle = self.corrections.skewAngle(axialInduction,self._skew)
+        # only trigonometry of the wake skew angle depends on the inductions
+        cosWakeSkew = math.cos(wakeSkewAngle)
+        sinWakeSkew = math.sin(wakeSkewAngle)
 
         # To get the inflow angle for tip loss evaluation
-        uxHub = self._UxPrime*(np.cos(self._skew)-axialInduction) \
-                + self._UyPrime*tangentialInduction*np.sin(wakeSkewAngle)*np.cos(self._azimuth)*(1.+np.sin(wakeSkewAngle)*np.sin(self._azimuth))
-        uyHub = self._UyPrime*(1.+tangentialInduction*np.cos(wakeSkewAngle)*(1.+np.sin(wakeSkewAngle)*np.sin(self._azimuth))) \
-                + self._UxPrime*np.cos(self._azimuth)*(axialInduction*np.tan(wakeSkewAngle/2.)-np.sin(self._skew))
+        uxHub, uyHub = self.hubVelocities(
+            axialInduction,tangentialInduction,wakeSkewAngle,cosWakeSkew,sinWakeSkew
+            )
 
-        W2 = uxHub**2. + uyHub**2.
-        sigmaPrime = self.rotor.nBlades * self._chord / (TWO_PI*self._radius)
+        W2 = uxHub*uxHub + uyHub*uyHub
+        sigmaPrime = self._sigmaPrime
 
-        inflowAngle = np.arctan2(uxHub, uyHub)
+        inflowAngle = math.atan2(uxHub, uyHub)
         attackAngle = inflowAngle - self._angle
-        lift = self._funLift(attackAngle)
-        drag = self._funDrag(attackAngle)
+        lift, drag = self._funPolar(attackAngle)
+        # reused by the post-processing if evaluated at the solution
+        self._last_evaluation = (
+            axialInduction,tangentialInduction,W2,attackAngle,lift,drag
+            )
 
-        Cx = lift * np.cos(inflowAngle) + drag * np.sin(inflowAngle)
-        Cy = lift * np.sin(inflowAngle) - drag * np.cos(inflowAngle)
+        cosInflow = math.cos(inflowAngle)
+        sinInflow = math.sin(inflowAngle)
+        Cx = lift * cosInflow + drag * sinInflow
+        Cy = lift * sinInflow - drag * cosInflow
 
         # tip loss evaluation
         lossFactor = self.corrections.hubTipLoss(
@@ -369,24 +759,25 @@ class NingCoupled(bem.BaseBEM):
             self.rotor.hubRadius,self.rotor.tipRadius,inflowAngle
             )
 
-        CtElement = W2 / self._uInfty ** 2. * sigmaPrime * Cx
-        CqElement = W2 / self._uInfty ** 2. * sigmaPrime * (
-            Cy*np.cos(wakeSkewAngle) - Cx*np.sin(wakeSkewAngle)*np.cos(self._azimuth)
+        uInfty2 = self._uInfty*self._uInfty
+        CtElement = W2 / uInfty2 * sigmaPrime * Cx
+        CqElement = W2 / uInfty2 * sigmaPrime * (
+            Cy*cosWakeSkew - Cx*sinWakeSkew*self._cosAzimuth
             )
 
-        residuals[0] = CtElement - self.CtMomentum(
+        thrustResidual = CtElement - self.CtMomentum(
             axialInduction,tangentialInduction,lossFactor,self._skew
             )
-        residuals[1] = CqElement - self.CqMomentum(
+        torqueResidual = CqElement - self.CqMomentum(
             axialInduction,tangentialInduction,self._UxPrime,self._UyPrime,
             lossFactor,wakeSkewAngle,self._azimuth,self._yaw
             )
 
-        return residuals[0]*residuals[0] + residuals[1]*residuals[1]
+        return thrustResidual, torqueResidual
     
 
     def solve(self,section:section.Section,azimuth:float,pitch:float,
-              velocity:list,angles:list=[0.0,0.0],
+              velocity:list,angles:tuple=(0.0,0.0),
               uInfty=None,UxPrime=None,UyPrime=None,
               skew=0.0,tStep=0.0):
         """Solve the coupled Ning algorithm.
@@ -440,50 +831,76 @@ class NingCoupled(bem.BaseBEM):
         angle = section.twist + pitch
         funDrag = section.airfoil.cd
         funLift = section.airfoil.cl
+        funPolar = section.airfoil.cl_cd
 
         self.update(
             uInfty=uInfty,UxPrime=UxPrime,UyPrime=UyPrime,
             skew=skew,yaw=yaw,azimuth=azimuth,
             chord=section.chord,radius=section.radius,angle=angle,
-            funLift=funLift,funDrag=funDrag
+            funLift=funLift,funDrag=funDrag,funPolar=funPolar
             )
 
-        # solve for axial and tangential inductions
-        res = minimize(
-            self.residuals,inductionsInit,
-            method='Powell',bounds=((axInd-0.2, axInd+0.2),(tanInd-0.2, tanInd+0.2)),
-            tol=1e-6,options={'disp': False}
-            )
+        # solve for axial and tangential inductions, minimum of the square
+        # sum of the residuals or root of the two residuals (Powell hybrid
+        # method), see useHybridRoot
+        bounds = ((axInd-0.2, axInd+0.2),(tanInd-0.2, tanInd+0.2))
+        res = None
+        if self.useHybridRoot:
+            res = optimize.root(
+                self.residualsVector,inductionsInit,method='hybr',
+                options={'xtol':1e-10}
+                )
+            isInBounds = all(
+                lower <= x <= upper for x, (lower, upper) in zip(res.x,bounds)
+                )
+            if not (res.success and isInBounds):
+                res = None
+        if res is None:
+            # no root close to the uncoupled solution or default, minimize
+            # the square sum of the residuals
+            res = minimize(
+                self.residuals,inductionsInit,
+                method='Powell',bounds=bounds,
+                tol=1e-6,options={'disp': False}
+                )
 
         ## Postprocessing
         inductions = res.x
         axialInduction = inductions[0]
         tangentialInduction = inductions[1]
+        if axialInduction > 1.0:
+            # shown once by the default filters, not for each section
+            warnings.warn('Unexpected propeller brake state...',RuntimeWarning)
 
         wakeSkewAngle = self.corrections.skewAngle(axialInduction,skew)
         axialInduction = self.corrections.dynamicInflow(
             axialInduction,UxUncoupled,section.radius,tStep
             )
 
-        # To get the inflow angle for tip loss evaluation
-        uxHub = UxPrime*(np.cos(skew)-axialInduction) \
-                + UyPrime*tangentialInduction*np.sin(wakeSkewAngle)*np.cos(azimuth)*(1.+np.sin(wakeSkewAngle)*np.sin(azimuth))
-        uyHub = UyPrime*(1.+tangentialInduction*np.cos(wakeSkewAngle)*(1.+np.sin(wakeSkewAngle)*np.sin(azimuth))) \
-                + UxPrime*np.cos(azimuth)*(axialInduction*np.tan(wakeSkewAngle/2.)-np.sin(skew))
-
-        inflowAngle = np.arctan2(uxHub, uyHub)
-
-        attackAngle = inflowAngle - angle
-        liftCoeff = funLift(attackAngle)
-        dragCoeff = funDrag(attackAngle)
-
-        normalCoeff = liftCoeff * np.cos(attackAngle) + dragCoeff * np.sin(attackAngle)
-        tangentialCoeff = -liftCoeff * np.sin(attackAngle) + dragCoeff * np.cos(attackAngle)
-
-        uRelative = np.sqrt(uxHub**2.+uyHub**2.)
-
-        normalForce = 0.5*self.rho*uRelative**2.*section.chord*normalCoeff
-        tangentialForce = 0.5*self.rho*uRelative**2.*section.chord*tangentialCoeff
+        if self._last_evaluation is not None \
+           and self._last_evaluation[:2] == (axialInduction,tangentialInduction):
+            # same state as the last evaluation of the residuals
+            _, _, W2, attackAngle, liftCoeff, dragCoeff = self._last_evaluation
+        else:
+            # To get the inflow angle for tip loss evaluation
+            uxHub, uyHub = self.hubVelocities(
+                axialInduction,tangentialInduction,wakeSkewAngle,
+                math.cos(wakeSkewAngle),math.sin(wakeSkewAngle)
+                )
+            W2 = uxHub*uxHub + uyHub*uyHub
+
+            inflowAngle = math.atan2(uxHub, uyHub)
+            attackAngle = inflowAngle - angle
+            liftCoeff, dragCoeff = funPolar(attackAngle)
+
+        # rotation from lift/drag to normal/tangential coefficients
+        cosAttack = math.cos(attackAngle)
+        sinAttack = math.sin(attackAngle)
+        normalCoeff = liftCoeff * cosAttack + dragCoeff * sinAttack
+        tangentialCoeff = -liftCoeff * sinAttack + dragCoeff * cosAttack
+
+        normalForce = 0.5*self.rho*W2*section.chord*normalCoeff
+        tangentialForce = 0.5*self.rho*W2*section.chord*tangentialCoeff
 
         return normalForce, tangentialForce, axialInduction, tangentialInduction
 
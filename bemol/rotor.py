@@ -1,7 +1,9 @@
 """Definition of simple rotor classes.
 
 Instances of the rotors available in the rotors folder are generated
-considering the default properties.
+considering the default properties, when first accessed. The instance is
+then kept in the module: later accesses in the same session, for instance
+from several samples, share its sections and airfoil polars.
 
 To use it: 'bemol.rotor.nameOfTheRotor'
 
@@ -9,7 +11,6 @@ To use it: 'bemol.rotor.nameOfTheRotor'
 
 from types import SimpleNamespace
 import yaml
-import os
 from pathlib import Path
 
 import numpy as np
@@ -40,13 +41,18 @@ class Rotor(object):
         if not blade_file.is_file():
             raise ValueError(f'Blade definition file not found in model folder ({folder}).')
         
-        blade_data = np.genfromtxt(blade_file,skip_header=1,dtype=str)
+        # small whitespace separated file with a header line, columns are
+        # radius, twist, chord and airfoil name
+        with open(blade_file) as stream:
+            next(stream)
+            blade_data = [line.split() for line in stream if line.strip()]
+        radius, twist, chords, list_sections = zip(*blade_data)
+
+        # per section properties stored as contiguous arrays
+        self.radius = np.ascontiguousarray(radius,dtype=np.float64)
+        self.twist = np.ascontiguousarray(twist,dtype=np.float64)
+        self.chords = np.ascontiguousarray(chords,dtype=np.float64)
 
-        self.radius = np.asarray(blade_data[:,0],dtype=float)
-        self.twist = np.asarray(blade_data[:,1],dtype=float)
-        self.chords = np.asarray(blade_data[:,2],dtype=float)
-
-        list_sections = blade_data[:,3]
         self.airfoils = SimpleNamespace()
         self.sections = []
         # get the airfoils
@@ -85,10 +91,26 @@ class Rotor(object):
         return self.sections.__iter__()
 
 
-# creating instances of predefined rotors with default properties
-script_path = os.path.abspath(__file__)
-for available_rotor in Path(script_path).parent.glob('rotors/*/'):
-    rotor_name = available_rotor.name
+# folders of the predefined rotors, by name
+_ROTORS_FOLDER = Path(__file__).resolve().parent/'rotors'
+_ROTOR_PATHS = {
+    folder.name: folder for folder in sorted(_ROTORS_FOLDER.glob('*/'))
+    if (folder/'blade.dat').is_file()
+    }
+
+
+def __getattr__(name):
+    """Instance of a predefined rotor with default properties.
+
+    The rotor is created at the first access and then stored in the module.
+    """
+    if name not in _ROTOR_PATHS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
     # TODO: remove use of globals, not good practice!
-    globals()[rotor_name] = Rotor(available_rotor)
-del script_path, rotor_name, available_rotor
\ No newline at end of file
+    globals()[name] = Rotor(_ROTOR_PATHS[name])
+    return globals()[name]
+
+
+def __dir__():
+    """Module attributes and predefined rotors."""
+    return sorted(set(globals()) | set(_ROTOR_PATHS))
@@ -4,6 +4,8 @@ Secondary correction models
 
 """
 
+import math
+
 import numpy as np
 from . import bem
 
@@ -38,13 +40,31 @@ class HubTipLoss:
 
         def __call__(self,radius,nBlades,hubRadius,tipRadius,inflowAngle):
 
-            fTip = nBlades/2.0*((tipRadius - radius) / (radius*np.abs(np.sin(inflowAngle))))
-            fTip = INV_TWO_PI*np.arccos(np.exp(-fTip))
+            if isinstance(radius,np.ndarray) or isinstance(inflowAngle,np.ndarray):
+                return self._array(radius,nBlades,hubRadius,tipRadius,inflowAngle)
+
+            # scalar inputs, math functions avoid the overhead of NumPy
+            # ufuncs on floats
+            sinInflow = abs(math.sin(inflowAngle))
+            if sinInflow == 0.0:
+                return self._array(radius,nBlades,hubRadius,tipRadius,inflowAngle)
+            halfBlades = nBlades/2.0
+
+            fTip = halfBlades*((tipRadius - radius) / (radius*sinInflow))
+            fRoot = halfBlades*((radius - hubRadius) / (hubRadius*sinInflow))
+
+            F = INV_TWO_PI*math.acos(math.exp(-fTip))*INV_TWO_PI*math.acos(math.exp(-fRoot))
+            return max(F,self._epsilon)
+
+        def _array(self,radius,nBlades,hubRadius,tipRadius,inflowAngle):
+            """Correction for arrays of sections or inflow angles."""
+            # common factor of the tip and root exponents
+            factor = -nBlades/2.0/np.abs(np.sin(inflowAngle))
 
-            fRoot = nBlades/2.0*((radius - hubRadius) / (hubRadius*np.abs(np.sin(inflowAngle))))
-            fRoot = INV_TWO_PI*np.arccos(np.exp(-fRoot))
+            fTip = INV_TWO_PI*np.arccos(np.exp(factor*((tipRadius - radius)/radius)))
+            fRoot = INV_TWO_PI*np.arccos(np.exp(factor*((radius - hubRadius)/hubRadius)))
 
-            return max(fTip*fRoot,self._epsilon)
+            return np.maximum(fTip*fRoot,self._epsilon)
 
 
 class SkewAngle:
@@ -187,16 +207,40 @@ class TurbulentWakeState:
         def __init__(self,beta:float=0.4,da:float=0.02) -> None:
             self.beta = beta
             self.da = da
-        
-        def __call__(self,axialInduction,lossFactor,skewAngle):
-            f0 = bem.BaseBEM.CT(self.beta,lossFactor,skewAngle)
-            fp0 = (
-                bem.BaseBEM.CT(self.beta + self.da,lossFactor,skewAngle)
-                - bem.BaseBEM.CT(self.beta - self.da,lossFactor,skewAngle)
+            # last scalar skew angle and its thrust coefficients without
+            # loss, replaced at once so threads read consistent pairs
+            self._lastCoefficients = (None, None)
+
+        def unitCoefficients(self,skewAngle):
+            """Thrust coefficient at beta, its derivative and thrust at a=1.
+
+            The thrust coefficient is proportional to the loss factor, the
+            values are given for a unit loss factor. They only depend on the
+            skew angle, constant during the solution of a section, the values
+            of the last scalar skew angle are stored.
+            """
+            isScalar = not isinstance(skewAngle,np.ndarray)
+            lastSkewAngle, lastCoefficients = self._lastCoefficients
+            if isScalar and skewAngle == lastSkewAngle:
+                return lastCoefficients
+            g0 = bem.BaseBEM.CT(self.beta,1.0,skewAngle)
+            gp0 = (
+                bem.BaseBEM.CT(self.beta + self.da,1.0,skewAngle)
+                - bem.BaseBEM.CT(self.beta - self.da,1.0,skewAngle)
                 ) / (2.*self.da)
             f1 = 2.*np.cos(skewAngle)
-            k2 = (f1-f0-fp0*(1.0 - self.beta)) / (1.0 - self.beta)**2.
+            if isScalar:
+                coefficients = (float(g0), float(gp0), float(f1))
+                self._lastCoefficients = (skewAngle, coefficients)
+                return coefficients
+            return g0, gp0, f1
+        
+        def __call__(self,axialInduction,lossFactor,skewAngle):
+            g0, gp0, f1 = self.unitCoefficients(skewAngle)
+            f0 = lossFactor*g0
+            fp0 = lossFactor*gp0
+            k2 = (f1-f0-fp0*(1.0 - self.beta)) / ((1.0 - self.beta)*(1.0 - self.beta))
             k1 = fp0 - 2.*k2*self.beta
             k0 = f1 - k1 - k2
 
-            return k0 + k1*axialInduction + k2*axialInduction**2.
\ No newline at end of file
+            return k0 + k1*axialInduction + k2*axialInduction*axialInduction
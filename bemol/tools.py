@@ -1,9 +1,18 @@
+import math
+
 import numpy as np
 
 
+__all__ = ['calculateVelocity','calculateVelocities','brentq']
+
+
 def calculateVelocity(wind:float,omega:float,rad:float,azi:float,yaw:float,tilt:float,precone:float):
     """Calculate relative velocity for a given wind configuration
 
+    The arguments can also be arrays, broadcast together: each
+    trigonometric function is evaluated once per angle, for instance for
+    all the azimuths of a cycle.
+
     Parameters
     ----------
     wind : float
@@ -22,11 +31,158 @@ def calculateVelocity(wind:float,omega:float,rad:float,azi:float,yaw:float,tilt:
         precone angle, radians
 
     """
+    cosYaw, sinYaw = np.cos(yaw), np.sin(yaw)
+    cosTilt = np.cos(tilt)
+    cosAzi, sinAzi = np.cos(azi), np.sin(azi)
+    cosPrecone, sinPrecone = np.cos(precone), np.sin(precone)
+
     Ux = wind*(
-            (np.cos(yaw)*np.sin(tilt)*np.cos(azi)+np.sin(yaw)*np.sin(azi))*np.sin(precone)
-            + np.cos(yaw)*np.cos(tilt)*np.cos(precone)
+            (cosYaw*np.sin(tilt)*cosAzi+sinYaw*sinAzi)*sinPrecone
+            + cosYaw*cosTilt*cosPrecone
         )
     Uy = wind*(
-            np.cos(tilt)*np.sin(precone)*np.sin(azi)-np.sin(yaw)*np.cos(azi)
-        ) + omega*rad*np.cos(precone)
-    return Ux, Uy
\ No newline at end of file
+            cosTilt*sinPrecone*sinAzi-sinYaw*cosAzi
+        ) + omega*rad*cosPrecone
+    return Ux, Uy
+
+
+def calculateVelocities(wind:float,omega:float,radii,azi:float,yaw:float,tilt:float,precone:float):
+    """Calculate relative velocities of several sections for a given wind configuration
+
+    Same as `calculateVelocity` for scalar angles, the trigonometric
+    functions are evaluated once for all the radii.
+
+    Parameters
+    ----------
+    wind : float
+        wind speed, m/s
+    omega : float
+        rotation velocity, rad/s
+    radii : array
+        radii of the sections, m
+    azi : float
+        azimuthal angle, radians
+    yaw : float
+        yaw angle, radians
+    tilt : float
+        tilt angle, radians
+    precone: float
+        precone angle, radians
+
+    Returns
+    -------
+    array of shape (number of radii, 2) with axial and tangential velocities.
+
+    """
+    cosYaw, sinYaw = math.cos(yaw), math.sin(yaw)
+    cosTilt, sinTilt = math.cos(tilt), math.sin(tilt)
+    cosAzi, sinAzi = math.cos(azi), math.sin(azi)
+    cosPrecone, sinPrecone = math.cos(precone), math.sin(precone)
+
+    radii = np.asarray(radii,dtype=float)
+    velocities = np.empty((radii.size,2))
+    # axial velocity does not depend on the radius
+    velocities[:,0] = wind*(
+            (cosYaw*sinTilt*cosAzi+sinYaw*sinAzi)*sinPrecone
+            + cosYaw*cosTilt*cosPrecone
+        )
+    velocities[:,1] = wind*(
+            cosTilt*sinPrecone*sinAzi-sinYaw*cosAzi
+        ) + omega*radii*cosPrecone
+    return velocities
+
+
+def brentq(fun,lower,upper,funLower=None,funUpper=None,
+           xtol:float=2e-12,rtol:float=4.*np.finfo(float).eps,maxiter:int=100):
+    """Find the roots of a vectorized function by Brent's method.
+
+    Element by element the same iterations as scipy.optimize.brentq, so the
+    same root is found when the function changes of sign several times in a
+    bracket. Iterations are made on all the elements at once until all of
+    them have converged, converged elements are not updated anymore and
+    are evaluated again at their last point: as with scipy, the last call
+    of `fun` is made at the last point evaluated for each element.
+
+    Parameters
+    ----------
+    fun : callable
+        vectorized function, takes and returns arrays of same shape than
+        the bounds.
+    lower : array
+        lower bounds of the brackets.
+    upper : array
+        upper bounds of the brackets.
+    funLower : array, optional
+        function values at the lower bounds, evaluated if not given.
+    funUpper : array, optional
+        function values at the upper bounds, evaluated if not given.
+    xtol : float, optional
+        absolute tolerance, same default as scipy brentq.
+    rtol : float, optional
+        relative tolerance, same default as scipy brentq.
+    maxiter : int, optional
+        maximum number of iterations.
+
+    Returns
+    -------
+    array with the roots.
+
+    """
+    xpre = np.array(lower,dtype=float)
+    xcur = np.array(upper,dtype=float)
+    fpre = fun(xpre) if funLower is None else np.array(funLower,dtype=float)
+    fcur = fun(xcur) if funUpper is None else np.array(funUpper,dtype=float)
+    if np.any((np.signbit(fpre) == np.signbit(fcur)) & (fpre != 0.) & (fcur != 0.)):
+        raise ValueError('f(a) and f(b) must have different signs')
+
+    root = np.where(fpre == 0.,xpre,xcur)
+    active = (fpre != 0.) & (fcur != 0.)
+    xblk, fblk = np.zeros_like(xcur), np.zeros_like(fcur)
+    spre, scur = np.zeros_like(xcur), np.zeros_like(xcur)
+    # last evaluated points
+    xlast = None
+    for _ in range(maxiter):
+        # bracket between the previous and the current estimates
+        isBracket = active & (fpre != 0.) & (fcur != 0.) & (np.signbit(fpre) != np.signbit(fcur))
+        xblk = np.where(isBracket,xpre,xblk)
+        fblk = np.where(isBracket,fpre,fblk)
+        spre = np.where(isBracket,xcur - xpre,spre)
+        scur = np.where(isBracket,xcur - xpre,scur)
+        # current estimate closest to the root
+        isSwap = active & (np.abs(fblk) < np.abs(fcur))
+        xpre, xcur, xblk = np.where(isSwap,xcur,xpre), np.where(isSwap,xblk,xcur), np.where(isSwap,xcur,xblk)
+        fpre, fcur, fblk = np.where(isSwap,fcur,fpre), np.where(isSwap,fblk,fcur), np.where(isSwap,fcur,fblk)
+
+        delta = (xtol + rtol*np.abs(xcur))/2.
+        sbis = (xblk - xcur)/2.
+        isConverged = active & ((fcur == 0.) | (np.abs(sbis) < delta))
+        root = np.where(isConverged,xcur,root)
+        active = active & ~isConverged
+        if not np.any(active):
+            if xlast is None:
+                # converged without iteration
+                fun(root)
+            return root
+
+        with np.errstate(divide='ignore',invalid='ignore'):
+            # interpolation (secant) or extrapolation (inverse quadratic)
+            dpre = (fpre - fcur)/(xpre - xcur)
+            dblk = (fblk - fcur)/(xblk - xcur)
+            stry = np.where(
+                xpre == xblk,
+                -fcur*(xcur - xpre)/(fcur - fpre),
+                -fcur*(fblk*dblk - fpre*dpre)/(dblk*dpre*(fblk - fpre)),
+                )
+        isShortStep = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre)) \
+                      & (2.*np.abs(stry) < np.minimum(np.abs(spre),3.*np.abs(sbis) - delta))
+        # bisection otherwise
+        spre = np.where(isShortStep,scur,sbis)
+        scur = np.where(isShortStep,stry,sbis)
+
+        xpre, fpre = xcur, fcur
+        step = np.where(np.abs(scur) > delta,scur,np.where(sbis > 0.,delta,-delta))
+        xcur = np.where(active,xcur + step,xcur)
+        xlast = xcur if xlast is None else np.where(active,xcur,xlast)
+        fcur = np.where(active,fun(xlast),fcur)
+
+    raise RuntimeError(f'Failed to converge after {maxiter} iterations.')
@@ -0,0 +1,52 @@
+"""
+
+Export of the sample results.
+
+"""
+
+import os
+
+
+def plotting() -> bool:
+    """If the figures are drawn, False if BEMOL_NO_PLOT is set.
+
+    The test suite only compares the exported results and skips the figures.
+    """
+    return not os.environ.get('BEMOL_NO_PLOT')
+
+
+def get_results_folder(name:str) -> str:
+    """Folder of the results of a sample.
+
+    Subfolder of `results` in the working directory, or of the folder given
+    by the BEMOL_RESULTS_ROOT environment variable (one per test worker).
+    It is only created by the first export, see `write_csv`.
+    """
+    return os.path.join(os.environ.get('BEMOL_RESULTS_ROOT','results'),name)
+
+
+def write_csv(path,columns:dict,index:bool=False):
+    """Write columns of same length to a CSV file.
+
+    Same file as `pandas.DataFrame(columns).to_csv(path,index=index)`,
+    without building the DataFrame.
+
+    Parameters
+    ----------
+    path : str or Path
+        output file.
+    columns : dict
+        column names and values (arrays or lists of floats).
+    index : bool, optional
+        if True, the first column is the row number, without name.
+
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)),exist_ok=True)
+    names = list(columns)
+    rows = zip(*(list(map(float,values)) for values in columns.values()))
+    with open(path,'w') as stream:
+        stream.write(','.join(([''] if index else []) + names) + '\n')
+        for i, row in enumerate(rows):
+            # repr: shortest representation read back to the same float
+            values = map(repr,row)
+            stream.write(','.join(([str(i)] if index else []) + list(values)) + '\n')
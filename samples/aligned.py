@@ -6,8 +6,8 @@ Sample code for aligned flow.
 
 import os
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 ## uncoment this to if ModuleNotFounError
 ## add repo folder to PYTHONPATH, if running from the samples folder
@@ -15,9 +15,12 @@ import matplotlib.pyplot as plt
 # sys.path.append(os.path.abspath(f'{__file__}/../..'))
 
 import bemol
+from _export import get_results_folder, plotting, write_csv
 
-results_folder = 'results/aligned'
-os.makedirs(results_folder,exist_ok=True)
+if plotting():
+    import matplotlib.pyplot as plt
+
+results_folder = get_results_folder('aligned')
 
 turbine = bemol.rotor.mexico
 wind = turbine.windRated
@@ -42,8 +45,10 @@ solver_uncoupled = bemol.ning.NingUncoupled(turbine,rho,corrections)
 forces, _ = solver_uncoupled.steady(
     azimuthAngle,pitch,wind,omega
 )
-data = pd.DataFrame({'fn':forces[:,0],'ft': forces[:,1]})
-data.to_csv(f'{results_folder}/results_aligned_uncoupled.csv',index=False)
+write_csv(
+    f'{results_folder}/results_aligned_uncoupled.csv',
+    {'fn':forces[:,0],'ft':forces[:,1]},
+    )
 
 
 solver_coupled = bemol.ning.NingCoupled(turbine,rho,corrections)
@@ -52,38 +57,39 @@ forces_coupled, _ = solver_coupled.steady(
     angles=[yawAngle,0.0],
     skew=0.0,
 )
-data = pd.DataFrame({'fn':forces_coupled[:,0],'ft':forces_coupled[:,1]})
-data.to_csv(f'{results_folder}/results_aligned_coupled.csv',index=False)
-
+write_csv(
+    f'{results_folder}/results_aligned_coupled.csv',
+    {'fn':forces_coupled[:,0],'ft':forces_coupled[:,1]},
+    )
 
-lib_folder = os.path.abspath(os.path.dirname(bemol.__file__))
-# get reference data for plot
-ref = {}
-for solver in ('AeroDeeP','CASTOR'):
-    ref[solver] = pd.read_csv(
-        f'{lib_folder}/rotors/mexico/ref/data_{solver}.csv',
-        index_col=None,comment='#',sep=',',
-        )
 
-for i, name in enumerate(['Fn','Ft']):
+if plotting():
+    lib_folder = os.path.abspath(os.path.dirname(bemol.__file__))
+    # get reference data for plot
+    ref = {}
+    for solver in ('AeroDeeP','CASTOR'):
+        ref[solver] = pd.read_csv(
+            f'{lib_folder}/rotors/mexico/ref/data_{solver}.csv',
+            index_col=None,comment='#',sep=',',
+            )[['radius','Fn','Ft']].to_numpy()
 
     # change orientation for tangent
-    factor = -1 if name == 'Ft' else 1
-
-    fig, ax = plt.subplots(1,1,constrained_layout=True)
+    factors = np.array((1.0,-1.0))
 
-    ax.plot(ref['AeroDeeP']['radius'],factor*ref['AeroDeeP'][name],
-            '-ob',linewidth=1.0,markersize=3,label='AeroDeeP (BEM)')
-    ax.plot(ref['CASTOR']['radius'],factor*ref['CASTOR'][name],
-            '-sk',linewidth=1.0,markersize=3,label='CASTOR (FVW)')
+    for i, name in enumerate(['Fn','Ft']):
 
-    ax.plot(turbine.radius,factor*forces[:,i],'-b',label='uncoupled BEM')
-    ax.plot(turbine.radius,factor*forces_coupled[:,i],'--r',label='coupled BEM')
-    ax.legend()
-    ax.grid()
-    ax.set_xlabel('radius, m')
-    ax.set_ylabel(f'{name}, N/m')
-    fig.savefig(f'{results_folder}/graph_aligned_force_{name}.png')
-    # plt.show() # uncomment if you want to show the figure
+        fig, ax = plt.subplots(1,1,constrained_layout=True)
 
+        ax.plot(ref['AeroDeeP'][:,0],factors[i]*ref['AeroDeeP'][:,i+1],
+                '-ob',linewidth=1.0,markersize=3,label='AeroDeeP (BEM)')
+        ax.plot(ref['CASTOR'][:,0],factors[i]*ref['CASTOR'][:,i+1],
+                '-sk',linewidth=1.0,markersize=3,label='CASTOR (FVW)')
 
+        ax.plot(turbine.radius,factors[i]*forces[:,i],'-b',label='uncoupled BEM')
+        ax.plot(turbine.radius,factors[i]*forces_coupled[:,i],'--r',label='coupled BEM')
+        ax.legend()
+        ax.grid()
+        ax.set_xlabel('radius, m')
+        ax.set_ylabel(f'{name}, N/m')
+        fig.savefig(f'{results_folder}/graph_aligned_force_{name}.png')
+        # plt.show() # uncomment if you want to show the figure
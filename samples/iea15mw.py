@@ -6,8 +6,8 @@ Sample code for the calculation of forces on IEA 15MW blade, aligned flow.
 
 import os
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 ## uncoment this to if ModuleNotFounError
 ## add repo folder to PYTHONPATH, if running from the samples folder
@@ -15,9 +15,12 @@ import matplotlib.pyplot as plt
 # sys.path.append(os.path.abspath(f'{__file__}/../..'))
 
 import bemol
+from _export import get_results_folder, plotting, write_csv
 
-results_folder = 'results/iea15mw'
-os.makedirs(results_folder,exist_ok=True)
+if plotting():
+    import matplotlib.pyplot as plt
+
+results_folder = get_results_folder('iea15mw')
 
 turbine = bemol.rotor.iea15mw
 wind = turbine.windRated
@@ -43,38 +46,39 @@ forces, _ = solver.steady(
     angles=[0.0,tilt],precone=precone,
     skew=0.0,
 )
-data = pd.DataFrame({'Fn':forces[:,0],'Ft':forces[:,1]})
-data.to_csv(f'{results_folder}/results_aligned_coupled.csv',index=False)
-
-lib_folder = os.path.abspath(os.path.dirname(bemol.__file__))
-# get reference data for plot
-ref = {}
-for solver in ('AeroDeeP','CASTOR'):
-    ref[solver] = pd.read_csv(
-        f'{lib_folder}/rotors/iea15mw/ref/data_{solver}.csv',
-        index_col=None,comment='#',sep=',',
-        )
-    
+write_csv(
+    f'{results_folder}/results_aligned_coupled.csv',
+    {'Fn':forces[:,0],'Ft':forces[:,1]},
+    )
 
-fig, axs = plt.subplots(1,2,constrained_layout=True)
+if plotting():
+    lib_folder = os.path.abspath(os.path.dirname(bemol.__file__))
+    # get reference data for plot
+    ref = {}
+    for solver in ('AeroDeeP','CASTOR'):
+        ref[solver] = pd.read_csv(
+            f'{lib_folder}/rotors/iea15mw/ref/data_{solver}.csv',
+            index_col=None,comment='#',sep=',',
+            )[['radius','Fn','Ft']].to_numpy()
 
-for name, ax in zip(['Fn','Ft'],axs):
-    
     # change orientation for tangent
-    factor = -1 if name == 'Ft' else 1
-
-    ax.plot(ref['AeroDeeP']['radius'],factor*ref['AeroDeeP'][name],
-            '-ob',linewidth=1.0,markersize=3,label='AeroDeeP (BEM)')
-    ax.plot(ref['CASTOR']['radius'],factor*ref['CASTOR'][name],
-            '-sk',linewidth=1.0,markersize=3,label='CASTOR (FVW)')
+    factors = np.array((1.0,-1.0))
     
-    ax.plot(turbine.radius,factor*data[name],'-',label='bemol (coupled BEM)')
-    ax.grid()
-    ax.set_xlabel('radius, m')
-    ax.set_ylabel(f'{name}, N/m')
-
-ax.legend() # legend only on the right plot
-fig.savefig(f'{results_folder}/graph_iea15mw_forces.png')
-#plt.show() # uncomment if you want to show the figure
 
+    fig, axs = plt.subplots(1,2,constrained_layout=True)
 
+    for i, (name, ax) in enumerate(zip(['Fn','Ft'],axs)):
+    
+        ax.plot(ref['AeroDeeP'][:,0],factors[i]*ref['AeroDeeP'][:,i+1],
+                '-ob',linewidth=1.0,markersize=3,label='AeroDeeP (BEM)')
+        ax.plot(ref['CASTOR'][:,0],factors[i]*ref['CASTOR'][:,i+1],
+                '-sk',linewidth=1.0,markersize=3,label='CASTOR (FVW)')
+    
+        ax.plot(turbine.radius,factors[i]*forces[:,i],'-',label='bemol (coupled BEM)')
+        ax.grid()
+        ax.set_xlabel('radius, m')
+        ax.set_ylabel(f'{name}, N/m')
+
+    ax.legend() # legend only on the right plot
+    fig.savefig(f'{results_folder}/graph_iea15mw_forces.png')
+    #plt.show() # uncomment if you want to show the figure
@@ -4,22 +4,24 @@ Blade pitch maneuver
 
 """
 
-import os
+import math
 
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
 ## uncoment following lines if ModuleNotFounError
 ## add repo folder to PYTHONPATH, if running from the samples folder
+# import os
 # import sys
 # sys.path.append(os.path.abspath(f'{__file__}/../..'))
 
 import bemol
+from _export import get_results_folder, plotting, write_csv
 
+if plotting():
+    import matplotlib.pyplot as plt
 
-results_folder = 'results/pitch_maneuver'
-os.makedirs(results_folder,exist_ok=True)
+
+results_folder = get_results_folder('pitch_maneuver')
 
 wind = 15.06
 omega = 44.5163679
@@ -48,15 +50,15 @@ corrections = [
 
 times = np.arange(0.0,50.0,tStep)
 pitchs = np.zeros(len(times))
-pitchs[times > 25.0] = np.radians(4.)
+pitchs[times > 25.0] = math.radians(4.)
 
 section = mexico[iElement]
 
-Fns_Coupled = []
-Fts_Coupled = []
+Fns_Coupled = np.empty(len(times))
+Fts_Coupled = np.empty(len(times))
 
-Fns_Uncoupled = []
-Fts_Uncoupled = []
+Fns_Uncoupled = np.empty(len(times))
+Fts_Uncoupled = np.empty(len(times))
 
 UxPrime = wind*np.cos(preconeAngle)
 UyPrime = omega*section.radius*np.cos(preconeAngle)
@@ -67,42 +69,50 @@ solver_coupled = bemol.ning.NingCoupled(mexico,rho,corrections)
 UxUncoupled, UyUncoupled = bemol.tools.calculateVelocity(
     wind,omega,section.radius,azimuthAngle,yawAngle,tiltAngle,preconeAngle
     )
+# inflow is constant over the maneuver, only the pitch changes
+velocity = (UxUncoupled,UyUncoupled)
+angles = (yawAngle,0.0)
 
-for (t, pitch) in zip(times, pitchs):
+for i, pitch in enumerate(pitchs):
 
     ## uncoupled BEM solution
     Fn, Ft, _, _ = solver_uncoupled.solve(
         section,azimuthAngle,pitch,
-        velocity=[UxUncoupled,UyUncoupled],angles=[yawAngle,0.0],
+        velocity=velocity,angles=angles,
         tStep=tStep,
         )
-    Fns_Uncoupled.append(Fn)
-    Fts_Uncoupled.append(Ft)
+    Fns_Uncoupled[i] = Fn
+    Fts_Uncoupled[i] = Ft
 
     ## coupled BEM solution
     Fn, Ft, _, _ = solver_coupled.solve(
         section,azimuthAngle,pitch,
-        velocity=[UxUncoupled,UyUncoupled],
-        angles=[yawAngle,0.0],
+        velocity=velocity,
+        angles=angles,
         uInfty=wind,
         UxPrime=UxPrime,UyPrime=UyPrime,
         skew=skewAngle,
         tStep=tStep)
-    Fns_Coupled.append(Fn)
-    Fts_Coupled.append(Ft)
+    Fns_Coupled[i] = Fn
+    Fts_Coupled[i] = Ft
 
-plt.plot(times,Fns_Uncoupled,label='uncoupled BEM')
-plt.plot(times,Fns_Coupled,label='coupled BEM')
-plt.xlabel('time, s')
-plt.ylabel('normal lineic force, N/m')
-plt.grid()
-plt.legend()
-plt.savefig(f'{results_folder}/graph_pitch_maneuver.png')
-# plt.show() # uncomment if you want to show the figure
+write_csv(
+    f'{results_folder}/results_pitch_maneuver_uncoupled.csv',
+    {'time':times,'fn':Fns_Uncoupled,'ft':Fts_Uncoupled},
+    )
 
+write_csv(
+    f'{results_folder}/results_pitch_maneuver_coupled.csv',
+    {'time':times,'fn':Fns_Coupled,'ft':Fts_Coupled},
+    )
 
-data = pd.DataFrame({'time':times,'fn':Fns_Uncoupled,'ft': Fts_Uncoupled})
-data.to_csv(f'{results_folder}/results_pitch_maneuver_uncoupled.csv',index=False)
 
-data = pd.DataFrame({'time':times,'fn':Fns_Coupled,'ft': Fts_Coupled})
-data.to_csv(f'{results_folder}/results_pitch_maneuver_coupled.csv',index=False)
\ No newline at end of file
+if plotting():
+    plt.plot(times,Fns_Uncoupled,label='uncoupled BEM')
+    plt.plot(times,Fns_Coupled,label='coupled BEM')
+    plt.xlabel('time, s')
+    plt.ylabel('normal lineic force, N/m')
+    plt.grid()
+    plt.legend()
+    plt.savefig(f'{results_folder}/graph_pitch_maneuver.png')
+    # plt.show() # uncomment if you want to show the figure
@@ -6,22 +6,24 @@ Solution for 3 sections for rotor under yaw.
 """
 
 
-import os
+import math
 
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 
 ## uncoment following lines if ModuleNotFounError
 ## add repo folder to PYTHONPATH, if running from the samples folder
+# import os
 # import sys
 # sys.path.append(os.path.abspath(f'{__file__}/../..'))
 
 import bemol
+from _export import get_results_folder, plotting, write_csv
 
+if plotting():
+    import matplotlib.pyplot as plt
 
-results_folder = 'results/yaw'
-os.makedirs(results_folder,exist_ok=True)
+
+results_folder = get_results_folder('yaw')
 
 wind = 15.06
 omega = 44.5163679
@@ -34,7 +36,7 @@ elements = [10, 18, 28]
 azimuthAngle = 0.0
 preconeAngle = 0.0
 tiltAngle = 0.0
-skewAngle = np.radians(30.)
+skewAngle = math.radians(30.)
 yawAngle = skewAngle
 
 mexico = bemol.rotor.mexico
@@ -62,32 +64,36 @@ forces_coupled, _, _ = solver_coupled.cycle(
 )
 
 azimuth_deg = np.degrees(azimuths)
-colors = ('red','blue','green')
-for i, (elt, color) in enumerate(zip(elements,colors)):
-    ## plot values
-    plt.plot(
-        azimuth_deg,forces_uncoupled[:,i,0],
-        label=f'r = {mexico[elt].radius:.2} m (#{elt})',color=color,
-        )
-    plt.plot(
-        azimuth_deg,forces_coupled[:,i,0],'--',
-        label='coupled BEM',color=color,
-        )
-    
+for i, elt in enumerate(elements):
     ## export data
-    data = pd.DataFrame(
-        {'azi':azimuth_deg,'fn':forces_uncoupled[:,i,0],'ft':forces_uncoupled[:,i,1]}
+    write_csv(
+        f'{results_folder}/results_yaw_uncoupled_i{elt}.csv',
+        {'azi':azimuth_deg,'fn':forces_uncoupled[:,i,0],'ft':forces_uncoupled[:,i,1]},
+        index=True,
         )
-    data.to_csv(f'{results_folder}/results_yaw_uncoupled_i{elt}.csv')
-    data = pd.DataFrame(
-        {'azi':azimuth_deg,'fn':forces_coupled[:,i,0],'ft':forces_coupled[:,i,1]}
+    write_csv(
+        f'{results_folder}/results_yaw_coupled_i{elt}.csv',
+        {'azi':azimuth_deg,'fn':forces_coupled[:,i,0],'ft':forces_coupled[:,i,1]},
+        index=True,
         )
-    data.to_csv(f'{results_folder}/results_yaw_coupled_i{elt}.csv')
 
 
-plt.xlabel('azimuth, deg')
-plt.ylabel('normal lineic force, N/m')
-plt.legend(loc='lower center',bbox_to_anchor=(0.5,1.0),ncol=3)
-plt.grid()
-plt.savefig(f'{results_folder}/graph_yaw_azimuthal.png')
-# plt.show() # uncomment if you want to show the figure
\ No newline at end of file
+if plotting():
+    colors = ('red','blue','green')
+    for i, (elt, color) in enumerate(zip(elements,colors)):
+        ## plot values
+        plt.plot(
+            azimuth_deg,forces_uncoupled[:,i,0],
+            label=f'r = {mexico[elt].radius:.2} m (#{elt})',color=color,
+            )
+        plt.plot(
+            azimuth_deg,forces_coupled[:,i,0],'--',
+            label='coupled BEM',color=color,
+            )
+
+    plt.xlabel('azimuth, deg')
+    plt.ylabel('normal lineic force, N/m')
+    plt.legend(loc='lower center',bbox_to_anchor=(0.5,1.0),ncol=3)
+    plt.grid()
+    plt.savefig(f'{results_folder}/graph_yaw_azimuthal.png')
+    # plt.show() # uncomment if you want to show the figure
@@ -1,7 +1,18 @@
 
 
+import os
 from pathlib import Path
 
+import pytest
+
+import bemol
+
+
+# polar of the mexico rotor used by the airfoil tests
+RISOE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(bemol.__file__)),'rotors','mexico','airfoils','RISOE.foil'
+    )
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -18,4 +29,21 @@ def pytest_sessionstart(session):
             raise ValueError(f'Reference folder {reference} does not exist!')
         session.config.reference = reference
         print('- Selected reference folder:',reference)
-    
\ No newline at end of file
+
+
+@pytest.fixture(scope='session')
+def risoe_airfoil():
+    """RISOE airfoil of the mexico rotor, read once per session."""
+    return bemol.airfoil.BaseAirfoil(RISOE_PATH)
+
+
+@pytest.fixture(scope='session')
+def mexico_rotor():
+    """Predefined mexico rotor."""
+    return bemol.rotor.mexico
+
+
+@pytest.fixture(scope='session')
+def iea15_rotor():
+    """Predefined IEA 15MW rotor."""
+    return bemol.rotor.iea15mw
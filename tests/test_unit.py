@@ -1,98 +1,363 @@
 
 """Unit tests"""
 
+import functools
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+import pytest
+from scipy import optimize
 
 import bemol
+from conftest import RISOE_PATH
 
-lib_path = os.path.abspath(os.path.dirname(bemol.__file__))
+# rated pitch of the IEA 15MW rotor, radians
+IEA15_PITCH_RATED = 0.06499140591234773
 
 
-def test_airfoil():
+@pytest.mark.io
+def test_airfoil(risoe_airfoil):
     """Test definition of the airfoil class."""
-    airfoil = bemol.airfoil.BaseAirfoil(f'{lib_path}/rotors/mexico/airfoils/RISOE.foil')
+    airfoil = risoe_airfoil
     # just check if can returns single value and array
     assert airfoil.cl(0.1).size == 1
-    assert type(airfoil._cl) == np.ndarray
+    assert isinstance(airfoil._cl,np.ndarray) and airfoil._cl.ndim == 1
+    assert airfoil._cl.dtype == np.float64
     assert airfoil._cl.size > 1
+    # scalar lookup same as linear interpolation
+    aoas = np.linspace(-0.5,0.5,101)
+    assert all(airfoil.cl_scalar(aoa) == airfoil.cl(aoa) for aoa in aoas)
+
+
+@pytest.mark.io
+@pytest.mark.parametrize('interpolator',['cubic','pchip','callable'])
+def test_airfoil_interpolator(risoe_airfoil,interpolator):
+    """Test interpolators of the polar, same values at the polar points."""
+    if interpolator == 'callable':
+        interpolator = lambda alpha, coefficients: functools.partial(
+            np.interp,xp=alpha,fp=coefficients
+            )
+    airfoil = bemol.airfoil.BaseAirfoil(RISOE_PATH,interpolator=interpolator)
+    alpha, cl, cd = risoe_airfoil.polar
+    np.testing.assert_allclose(airfoil.cl(alpha),cl,rtol=0.0,atol=1e-12)
+    np.testing.assert_allclose(airfoil.cd(alpha),cd,rtol=0.0,atol=1e-12)
+    # scalar lookups call the interpolator
+    assert math.isclose(airfoil.cl_scalar(alpha[3]),cl[3],rel_tol=0.0,abs_tol=1e-12)
+    # values of the bounds outside of the polar, as the linear interpolation
+    outside = np.array([alpha[0] - 0.1,alpha[-1] + 0.1])
+    np.testing.assert_allclose(airfoil.cl(outside),risoe_airfoil.cl(outside),rtol=0.0,atol=1e-12)
+    np.testing.assert_allclose(airfoil.cd(outside),risoe_airfoil.cd(outside),rtol=0.0,atol=1e-12)
+
+
+@pytest.mark.io
+def test_airfoil_unknown_interpolator():
+    """Test error for an interpolator name not available."""
+    with pytest.raises(ValueError,match='Unknown interpolator'):
+        bemol.airfoil.BaseAirfoil(RISOE_PATH,interpolator='akima')
+
 
+@pytest.mark.io
+def test_airfoil_cached(risoe_airfoil):
+    """Test polar file read once for several airfoils."""
+    hits = bemol.airfoil._readPolar.cache_info().hits
+    airfoil = bemol.airfoil.BaseAirfoil(RISOE_PATH)
+    assert bemol.airfoil._readPolar.cache_info().hits == hits + 1
+    # independent copies of the cached polar
+    assert airfoil._cl.flags.writeable
+    assert not np.shares_memory(airfoil._cl,risoe_airfoil._cl)
+    # values at the polar angles of attack, in degrees in the file
+    polar = np.genfromtxt(RISOE_PATH)
+    np.testing.assert_array_equal(airfoil.alpha,np.radians(polar[:,0]))
+    np.testing.assert_array_equal(airfoil.cl(airfoil.alpha),polar[:,1])
+    np.testing.assert_array_equal(airfoil.cd(airfoil.alpha),polar[:,2])
 
-def test_rotor():
+
+def test_rotor(mexico_rotor,iea15_rotor):
     """Test definition of the rotor class."""
 
     # test definition of rotors
-    assert 'mexico' in bemol.rotor.__dict__
-    assert 'iea15mw' in bemol.rotor.__dict__
+    assert 'mexico' in dir(bemol.rotor)
+    assert 'iea15mw' in dir(bemol.rotor)
 
-    rotor = bemol.rotor.mexico
+    rotor = mexico_rotor
     # check iterator
-    for i, section in enumerate(rotor):
-        assert rotor[i] is section
+    sections = list(rotor)
+    assert len(sections) == len(rotor.sections)
+    assert all(section is rotor[i] for i, section in enumerate(sections))
 
     # test definition of iea15mw rotor
-    iea15 = bemol.rotor.iea15mw
-    assert iea15.pitchRated == 0.06499140591234773
-
-
-
-def test_secondary_module():
-    """Test definition of secondary effects."""
-    dummy_rotor = bemol.rotor.mexico
-
-    # check if all the secondary models are selected when user is not defining them
-    for corrections in (None,[],{}):
-        model = bemol.bem.BaseBEM(dummy_rotor,corrections=corrections)
-        assert hasattr(model.corrections,'hubTipLoss')
-        assert hasattr(model.corrections,'skewAngle')
-        assert hasattr(model.corrections,'dynamicInflow')
-        assert hasattr(model.corrections,'yawModel')
-        assert hasattr(model.corrections,'turbulentWakeState')
-
-    # check if the Dummy is selected everytime
-    model = bemol.bem.BaseBEM(dummy_rotor)
-    assert model.corrections.hubTipLoss.__class__ is bemol.secondary.HubTipLoss.Dummy
-    assert model.corrections.skewAngle.__class__ is bemol.secondary.SkewAngle.Dummy
-    assert model.corrections.dynamicInflow.__class__ is bemol.secondary.DynamicInflow.Dummy
-    assert model.corrections.yawModel.__class__ is bemol.secondary.YawModel.Dummy
-    assert model.corrections.turbulentWakeState.__class__ is bemol.secondary.TurbulentWakeState.Dummy
-
-    # define a model with a few custom corrections
-    model = bemol.bem.BaseBEM(
-        dummy_rotor,
-        corrections=[bemol.secondary.HubTipLoss.Prandtl,bemol.secondary.SkewAngle.Burton]
+    iea15 = iea15_rotor
+    assert math.isclose(iea15.pitchRated,IEA15_PITCH_RATED,rel_tol=1e-12,abs_tol=0.0)
+
+
+
+# class of the secondary corrections when not defined by the user
+DUMMY_TYPES = dict(
+    hubTipLoss=bemol.secondary.HubTipLoss.Dummy,
+    skewAngle=bemol.secondary.SkewAngle.Dummy,
+    dynamicInflow=bemol.secondary.DynamicInflow.Dummy,
+    yawModel=bemol.secondary.YawModel.Dummy,
+    turbulentWakeState=bemol.secondary.TurbulentWakeState.Dummy,
+    )
+
+
+def _types(corrections) -> dict:
+    """Class of each secondary correction."""
+    return {name:type(getattr(corrections,name)) for name in DUMMY_TYPES}
+
+
+# classes when only the tip loss and the skew angle are defined
+CUSTOM_TYPES = dict(
+    DUMMY_TYPES,
+    hubTipLoss=bemol.secondary.HubTipLoss.Prandtl,
+    skewAngle=bemol.secondary.SkewAngle.Burton,
+    )
+
+# user definition of the corrections and expected classes
+CASES = (
+    ('default-none',None,DUMMY_TYPES),
+    ('default-list',[],DUMMY_TYPES),
+    ('default-dict',{},DUMMY_TYPES),
+    (
+        'custom-list',
+        [bemol.secondary.HubTipLoss.Prandtl,bemol.secondary.SkewAngle.Burton],
+        CUSTOM_TYPES,
+    ),
+    (
+        'custom-dict',
+        dict(hubTipLoss=bemol.secondary.HubTipLoss.Prandtl,skewAngle=bemol.secondary.SkewAngle.Burton),
+        CUSTOM_TYPES,
+    ),
+    (
+        'mixed-instance',
+        [bemol.secondary.HubTipLoss.Prandtl(),bemol.secondary.SkewAngle.Burton],
+        CUSTOM_TYPES,
+    ),
+    )
+
+
+@pytest.mark.parametrize('name,config,expected',CASES,ids=[case[0] for case in CASES])
+def test_bem_correction_selection(mexico_rotor,name,config,expected):
+    """Test selection of the secondary models, Dummy when not defined by user."""
+    model = bemol.bem.BaseBEM(mexico_rotor,corrections=config)
+    assert _types(model.corrections) == expected
+    if name == 'mixed-instance':
+        # instances given by the user are kept
+        assert model.corrections.hubTipLoss is config[0]
+
+
+def test_bem_correction_added(mexico_rotor):
+    """Test corrections set after construction are iterated."""
+    model = bemol.bem.BaseBEM(mexico_rotor)
+    assert {id(corr) for corr in model.corrections} == {
+        id(getattr(model.corrections,name)) for name in DUMMY_TYPES
+        }
+    assert model.corrections._restartable == ()
+    knudsen = bemol.secondary.DynamicInflow.Knudsen()
+    model.corrections.dynamicInflow = knudsen
+    model.corrections.extra = bemol.secondary.HubTipLoss.Prandtl()
+    assert model.corrections.extra in list(model.corrections)
+    assert model.corrections._restartable == (knudsen,)
+
+
+def test_bem_twss_added(mexico_rotor):
+    """Test high-induction correction set after construction is used."""
+    buhl = bemol.secondary.TurbulentWakeState.Buhl()
+    model = bemol.ning.NingCoupled(mexico_rotor,1.225)
+    model.corrections.turbulentWakeState = buhl
+    expected = bemol.ning.NingCoupled(mexico_rotor,1.225,[buhl]).CtMomentum(0.6,0.0,1.0,0.0)
+    assert model.CtMomentum(0.6,0.0,1.0,0.0) == expected == buhl(0.6,1.0,0.0)
+
+
+@pytest.fixture(scope='module')
+def ning_solvers(mexico_rotor):
+    """Uncoupled and coupled Ning solvers with default corrections."""
+    solver_uncoupled = bemol.ning.NingUncoupled(mexico_rotor,1.0,None)
+    solver_coupled = bemol.ning.NingCoupled(mexico_rotor,1.0,None)
+    return solver_uncoupled, solver_coupled
+
+
+def test_ning_correction_sharing(ning_solvers):
+    """Test if corrections of nested solvers are the same instance."""
+    ## TOOD: maybe this is not always the wanted behavior!
+    solver_uncoupled, solver_coupled = ning_solvers
+    assert solver_coupled.corrections.dynamicInflow is not solver_uncoupled.corrections.dynamicInflow
+    assert solver_coupled.corrections.dynamicInflow is solver_coupled._uncoupled.corrections.dynamicInflow
+    assert all(
+        getattr(solver_coupled._uncoupled.corrections,name) is getattr(solver_coupled.corrections,name)
+        for name in DUMMY_TYPES
         )
-    assert model.corrections.hubTipLoss.__class__ is bemol.secondary.HubTipLoss.Prandtl
-    assert model.corrections.skewAngle.__class__ is bemol.secondary.SkewAngle.Burton
-    assert model.corrections.dynamicInflow.__class__ is bemol.secondary.DynamicInflow.Dummy
-    assert model.corrections.yawModel.__class__ is bemol.secondary.YawModel.Dummy
-    assert model.corrections.turbulentWakeState.__class__ is bemol.secondary.TurbulentWakeState.Dummy
-
-    # same as before, but with dict input define a model with a few custom corrections
-    model = bemol.bem.BaseBEM(
-        dummy_rotor,
-        corrections=dict(
-            hubTipLoss=bemol.secondary.HubTipLoss.Prandtl,
-            skewAngle=bemol.secondary.SkewAngle.Burton
+
+
+# stateless corrections, the Buhl model stores the coefficients of the last
+# skew angle
+EXECUTOR_CORRECTIONS = [
+    bemol.secondary.HubTipLoss.Prandtl,bemol.secondary.SkewAngle.Burton,
+    bemol.secondary.YawModel.PittAndPeters,bemol.secondary.TurbulentWakeState.Buhl,
+    ]
+
+
+@pytest.mark.parametrize('model',['NingUncoupled','NingCoupled'])
+def test_steady_executor(mexico_rotor,monkeypatch,model):
+    """Test steady solution by groups of sections in threads against the serial one."""
+    # several groups even on a single processor
+    monkeypatch.setattr(os,'cpu_count',lambda: 3)
+    solver = getattr(bemol.ning,model)(mexico_rotor,1.225,EXECUTOR_CORRECTIONS)
+    inputs = (0.3,np.radians(-2.3),15.0,44.5)
+    angles = (np.radians(30.0),0.0)
+    forces, inductions = solver.steady(*inputs,angles=angles)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        forcesThreads, inductionsThreads = solver.steady(
+            *inputs,angles=angles,executor=executor
             )
+    # same solution up to the warm start of the first section of each group
+    np.testing.assert_allclose(forcesThreads,forces,rtol=1e-12,atol=1e-15)
+    np.testing.assert_allclose(inductionsThreads,inductions,rtol=1e-12,atol=1e-15)
+
+
+@pytest.mark.parametrize('model',['NingUncoupled','NingCoupled'])
+def test_cycle_executor(mexico_rotor,monkeypatch,model):
+    """Test cycle by groups of sections in threads against the serial one."""
+    monkeypatch.setattr(os,'cpu_count',lambda: 3)
+    solver = getattr(bemol.ning,model)(mexico_rotor,1.225,EXECUTOR_CORRECTIONS)
+    inputs = (np.radians(-2.3),15.0,44.5)
+    options = dict(angles=(np.radians(30.0),0.0),n_phi=5,elements=range(2,20))
+    forces, inductions, azimuths = solver.cycle(*inputs,**options)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        forcesThreads, inductionsThreads, azimuthsThreads = solver.cycle(
+            *inputs,executor=executor,**options
+            )
+    assert forcesThreads.shape == (5,18,2)
+    np.testing.assert_array_equal(azimuthsThreads,azimuths)
+    np.testing.assert_allclose(forcesThreads,forces,rtol=1e-12,atol=1e-15)
+    np.testing.assert_allclose(inductionsThreads,inductions,rtol=1e-12,atol=1e-15)
+
+
+def test_brentq():
+    """Test vectorized brentq against scipy on brackets with several roots."""
+    rng = np.random.default_rng(0)
+    frequencies = rng.uniform(1.0,40.0,200)
+    fun = lambda x: np.sin(frequencies*x) - 0.3*np.cos(3.0*x)
+    lower = rng.uniform(-3.0,0.0,200)
+    upper = rng.uniform(0.1,3.0,200)
+    isBracket = np.sign(fun(lower)) != np.sign(fun(upper))
+    frequencies = frequencies[isBracket]
+    lower, upper = lower[isBracket], upper[isBracket]
+    roots = bemol.tools.brentq(fun,lower,upper)
+    # same root, bit for bit, as the scalar brentq
+    expected = [
+        optimize.brentq(lambda x: math.sin(frequency*x) - 0.3*math.cos(3.0*x),a,b)
+        for frequency, a, b in zip(frequencies,lower,upper)
+        ]
+    np.testing.assert_array_equal(roots,expected)
+
+
+def test_brentq_bounds():
+    """Test roots at the bounds, tolerance and failures of the vectorized brentq."""
+    squares = np.array([0.5,2.0,3.0,4.0])
+    fun = lambda x: x*x - squares
+    # root at the upper bound of the last bracket
+    lower = np.array([0.0,1.0,1.0,0.0])
+    upper = np.array([1.0,2.0,2.0,2.0])
+    roots = bemol.tools.brentq(fun,lower,upper)
+    assert roots[-1] == 2.0
+    np.testing.assert_allclose(roots,np.sqrt(squares),rtol=0.0,atol=1e-11)
+    # coarse tolerance
+    rough = bemol.tools.brentq(fun,lower,upper,xtol=1e-3,rtol=0.0)
+    assert np.all(np.abs(rough - np.sqrt(squares)) < 1e-3)
+    assert np.any(np.abs(rough - np.sqrt(squares)) > 1e-11)
+    # no sign change in the second bracket
+    with pytest.raises(ValueError):
+        bemol.tools.brentq(fun,lower,np.array([1.0,1.2,2.0,2.0]))
+    # not converged, as scipy brentq
+    with pytest.raises(RuntimeError):
+        bemol.tools.brentq(fun,lower,upper,maxiter=3)
+
+
+class ScalarHubTipLoss:
+    """Prandtl hub/tip loss written for floats only, selected by its name."""
+
+    def __call__(self,radius,nBlades,hubRadius,tipRadius,inflowAngle):
+        sinInflow = abs(math.sin(inflowAngle))
+        fTip = nBlades/2.0*(tipRadius - radius)/(radius*sinInflow)
+        fRoot = nBlades/2.0*(radius - hubRadius)/(hubRadius*sinInflow)
+        F = 2.0/math.pi*math.acos(math.exp(-fTip))*2.0/math.pi*math.acos(math.exp(-fRoot))
+        return max(F,1e-12)
+
+
+# off-design points (rotor, wind, omega, pitch, yaw), the residuals of some
+# sections change of sign several times in their bracket
+BLADE_CASES = (
+    ('mexico_rotor',3.0,44.5,0.0,0.0),
+    ('mexico_rotor',3.0,44.5,0.3,0.0),
+    ('mexico_rotor',15.0,44.5,np.radians(-2.3),np.radians(30.0)),
+    ('mexico_rotor',24.0,22.25,0.6,0.5),
+    ('mexico_rotor',6.0,60.0,-0.1,0.5),
+    ('iea15_rotor',3.0,0.79,-0.1,0.0),
+    ('iea15_rotor',10.0,1.2,0.0,0.5),
+    ('iea15_rotor',24.0,0.79,0.3,0.5),
+    ('iea15_rotor',15.0,0.3,0.6,0.5),
+    )
+
+
+@pytest.mark.parametrize('rotor,wind,omega,pitch,yaw',BLADE_CASES)
+def test_solve_blade(request,rotor,wind,omega,pitch,yaw):
+    """Test solution of all the sections at once against the one by section."""
+    rotor = request.getfixturevalue(rotor)
+    solver = bemol.ning.NingUncoupled(rotor,1.225,EXECUTOR_CORRECTIONS)
+    azimuth, angles = 0.7, (yaw,0.0)
+    velocities = bemol.tools.calculateVelocities(
+        wind,omega,rotor.radius,azimuth,angles[0],angles[1],0.0
         )
-    assert model.corrections.hubTipLoss.__class__ is bemol.secondary.HubTipLoss.Prandtl
-    assert model.corrections.skewAngle.__class__ is bemol.secondary.SkewAngle.Burton
-    assert model.corrections.dynamicInflow.__class__ is bemol.secondary.DynamicInflow.Dummy
-    assert model.corrections.yawModel.__class__ is bemol.secondary.YawModel.Dummy
-    assert model.corrections.turbulentWakeState.__class__ is bemol.secondary.TurbulentWakeState.Dummy
-
-    # mix class and instance
-    hub_corr = bemol.secondary.HubTipLoss.Prandtl()
-    model = bemol.bem.BaseBEM(
-        dummy_rotor,corrections=[hub_corr,bemol.secondary.SkewAngle.Burton]
-        )
-    assert model.corrections.hubTipLoss is hub_corr
-    assert model.corrections.skewAngle.__class__ is bemol.secondary.SkewAngle.Burton
+    with np.errstate(divide='ignore',invalid='ignore'):
+        blade = np.stack(solver.solveBlade(
+            rotor.sections,azimuth,pitch,velocities=velocities,angles=angles
+            ),axis=-1)
+        sections = np.array([
+            solver.solve(section,azimuth,pitch,velocity=velocity,angles=angles)
+            for section, velocity in zip(rotor.sections,velocities)
+            ])
+    # same roots, up to the brentq tolerance on ill-conditioned sections
+    np.testing.assert_allclose(blade,sections,rtol=1e-6,atol=1e-9)
 
-    # check if corrections of nested solvers are the same instance
-    ## TOOD: maybe this is not always the wanted behavior!
-    solver_uncoupled = bemol.ning.NingUncoupled(dummy_rotor,1.0,corrections)
-    solver_coupled = bemol.ning.NingCoupled(dummy_rotor,1.0,corrections)
-    assert solver_coupled.corrections.dynamicInflow is not solver_uncoupled.corrections.dynamicInflow
-    assert solver_coupled.corrections.dynamicInflow is solver_coupled._uncoupled.corrections.dynamicInflow
\ No newline at end of file
+
+def test_solve_history(mexico_rotor):
+    """Test solution of a section independent of the previous solutions."""
+    solver = bemol.ning.NingUncoupled(mexico_rotor,1.225,EXECUTOR_CORRECTIONS)
+    velocities = bemol.tools.calculateVelocities(3.0,44.5,mexico_rotor.radius,0.0,0.0,0.0,0.0)
+    cases = list(zip(mexico_rotor.sections,velocities))
+    forward = [solver.solve(section,0.0,0.3,velocity=velocity) for section, velocity in cases]
+    backward = [solver.solve(section,0.0,0.3,velocity=velocity) for section, velocity in cases[::-1]]
+    assert forward == backward[::-1]
+
+
+def test_steady_scalar_correction(mexico_rotor):
+    """Test steady solution with a user correction that only accepts floats."""
+    solver = bemol.ning.NingUncoupled(mexico_rotor,1.225,[ScalarHubTipLoss()])
+    assert not solver._useSolveBlade()
+    forces, inductions = solver.steady(0.0,0.0,15.0,44.5)
+    reference = bemol.ning.NingUncoupled(mexico_rotor,1.225,[bemol.secondary.HubTipLoss.Prandtl])
+    assert reference._useSolveBlade()
+    forcesReference, _ = reference.steady(0.0,0.0,15.0,44.5)
+    np.testing.assert_allclose(forces,forcesReference,rtol=1e-9,atol=1e-12)
+
+
+def test_buhl_coefficients():
+    """Test stored coefficients of the Buhl model match the skew angle."""
+    buhl = bemol.secondary.TurbulentWakeState.Buhl()
+    fresh = [bemol.secondary.TurbulentWakeState.Buhl().unitCoefficients(chi) for chi in (0.0,0.4)]
+    for _ in range(2):
+        assert buhl.unitCoefficients(0.0) == fresh[0]
+        assert buhl.unitCoefficients(0.4) == fresh[1]
+    assert buhl._lastCoefficients == (0.4,fresh[1])
+
+
+def test_coupled_hybrid_root(mexico_rotor):
+    """Test coupled roots of hybr close to the default Powell minimization."""
+    solver = bemol.ning.NingCoupled(mexico_rotor,1.225,EXECUTOR_CORRECTIONS[:2])
+    forces, _ = solver.steady(0.0,0.0,15.0,44.5,uInfty=15.0,elements=range(4,30,5))
+    solver.useHybridRoot = True
+    forcesRoot, _ = solver.steady(0.0,0.0,15.0,44.5,uInfty=15.0,elements=range(4,30,5))
+    np.testing.assert_allclose(forcesRoot,forces,rtol=1e-4)